@@ -1,5 +1,25 @@
 """CivitAI API client module."""
 
-from .client import CivitAIClient
+from .client import (
+    CivitAIClient,
+    get_client,
+    get_download_session,
+    APIError,
+    APITimeout,
+    APIConnectionError,
+    APINotFound,
+    APIServiceUnavailable,
+    APIInvalidResponse,
+)
 
-__all__ = ["CivitAIClient"]
\ No newline at end of file
+__all__ = [
+    "CivitAIClient",
+    "get_client",
+    "get_download_session",
+    "APIError",
+    "APITimeout",
+    "APIConnectionError",
+    "APINotFound",
+    "APIServiceUnavailable",
+    "APIInvalidResponse",
+]
\ No newline at end of file
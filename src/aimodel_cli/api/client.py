@@ -1,18 +1,309 @@
 """CivitAI API client implementation."""
 
 import hashlib
-import json
+import io
+import os
+import queue
 import re
+import threading
+import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
 from urllib3.util.retry import Retry
 
+from .. import jsonio
 from ..config import get_config
+from ..constants import MODEL_ID_RE
+
+if TYPE_CHECKING:
+    from urllib3.connectionpool import ConnectionPool
+    from urllib3.response import BaseHTTPResponse
+
+# Connection pool sizing; large enough that concurrent lookups keep their
+# connections alive instead of discarding and re-handshaking them.
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Files at least this large are hashed with reads and hashing overlapped
+PIPELINED_HASH_THRESHOLD = 256 << 20
+
+_SAFE_VALUE_RE = re.compile(r'[A-Za-z0-9_.~-]*\Z')
+
+
+def _parse_deadline(value: str) -> datetime:
+    """Parse a CivitAI ``YYYY-MM-DDTHH:MM:SS.fffZ`` timestamp as UTC.
+    
+    Fractional seconds are ignored; they don't matter for deadline checks.
+    
+    Raises:
+        ValueError: If the timestamp is malformed or not in UTC
+    """
+    if not (
+        len(value) >= 20
+        and value[4] == value[7] == '-'
+        and value[10] == 'T'
+        and value.endswith('Z')
+    ):
+        raise ValueError(f"Unsupported timestamp: {value!r}")
+    
+    return datetime(
+        int(value[0:4]), int(value[5:7]), int(value[8:10]),
+        int(value[11:13]), int(value[14:16]), int(value[17:19]),
+        tzinfo=timezone.utc,
+    )
+
+
+def _is_version_available(version: Dict[str, Any], now: datetime) -> bool:
+    """Check whether a model version has files and is out of early access."""
+    if not version.get('files'):
+        return False
+    
+    deadline = version.get('earlyAccessDeadline')
+    if not deadline:
+        return True
+    
+    try:
+        return _parse_deadline(deadline) < now
+    except ValueError:
+        # If we can't parse the date, include the version
+        return True
+
+
+def _sha256_double_buffered(f: io.RawIOBase, chunk_size: int) -> "hashlib._Hash":
+    """Hash a file while a reader thread fills the next buffer.
+    
+    Both ``readinto`` and ``sha256.update`` release the GIL, so reading one
+    buffer overlaps with hashing the other.
+    
+    Args:
+        f: Unbuffered binary file object
+        chunk_size: Size of each of the two buffers
+        
+    Returns:
+        SHA256 hash object
+    """
+    free: "queue.Queue[bytearray]" = queue.Queue()
+    filled: "queue.Queue[Any]" = queue.Queue()
+    for _ in range(2):
+        free.put(bytearray(chunk_size))
+    
+    def reader() -> None:
+        try:
+            while True:
+                buffer = free.get()
+                n = f.readinto(buffer)
+                filled.put((buffer, n))
+                if not n:
+                    return
+        except BaseException as e:
+            filled.put(e)
+    
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    
+    sha256_hash = hashlib.sha256()
+    while True:
+        item = filled.get()
+        if isinstance(item, BaseException):
+            raise item
+        buffer, n = item
+        if not n:
+            break
+        sha256_hash.update(memoryview(buffer)[:n])
+        free.put(buffer)
+    
+    thread.join()
+    return sha256_hash
+
+
+def _encode_value(value: Any) -> str:
+    """Encode a single query value, quoting only when necessary."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    
+    value = str(value)
+    if _SAFE_VALUE_RE.match(value):
+        return value
+    return urllib.parse.quote(value, safe='')
+
+
+def _encode_params(params: Dict[str, Any]) -> str:
+    """Build a query string in a single pass.
+    
+    List values are emitted as repeated keys and ``None`` values are skipped.
+    
+    Args:
+        params: Query parameters
+        
+    Returns:
+        Encoded query string
+    """
+    parts = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                parts.append(f"{key}={_encode_value(item)}")
+        else:
+            parts.append(f"{key}={_encode_value(value)}")
+    
+    return "&".join(parts)
+
+
+class APIError(Exception):
+    """Exception raised for CivitAI API errors."""
+    pass
+
+
+def _parse_model_id(model_id: Any) -> int:
+    """Convert a model ID to an integer before it is used in a URL or path.
+    
+    Args:
+        model_id: Model ID, typically read from a local sidecar
+        
+    Returns:
+        Model ID as an integer
+        
+    Raises:
+        APIError: If the ID is not an integer
+    """
+    try:
+        return int(model_id)
+    except (TypeError, ValueError):
+        raise APIError(f"Invalid model ID: {model_id!r}")
+
+
+class APITimeout(APIError):
+    """Exception raised when an API request times out."""
+    pass
+
+
+class APIConnectionError(APIError):
+    """Exception raised when the API cannot be reached."""
+    pass
+
+
+class APINotFound(APIError):
+    """Exception raised when the requested resource does not exist."""
+    pass
+
+
+class APIServiceUnavailable(APIError):
+    """Exception raised when the API is unavailable or throttling."""
+    pass
+
+
+class APIInvalidResponse(APIError):
+    """Exception raised when the API returns malformed JSON."""
+    pass
+
+
+class _BudgetedRetry(Retry):
+    """Retry policy that draws every retry from a shared token bucket.
+    
+    The bucket refills at ``BUDGET_RATE`` tokens per second up to
+    ``BUDGET_CAPACITY``. Once it is empty, failing requests give up
+    immediately instead of piling more load onto a degraded API.
+    """
+    
+    BUDGET_RATE = 1.0
+    BUDGET_CAPACITY = 10.0
+    
+    _budget_tokens = BUDGET_CAPACITY
+    _budget_updated = time.monotonic()
+    _budget_lock = threading.Lock()
+    
+    @classmethod
+    def _take_token(cls) -> bool:
+        """Consume one retry token, returning False if the budget is spent."""
+        with _BudgetedRetry._budget_lock:
+            now = time.monotonic()
+            elapsed = now - _BudgetedRetry._budget_updated
+            _BudgetedRetry._budget_updated = now
+            _BudgetedRetry._budget_tokens = min(
+                cls.BUDGET_CAPACITY,
+                _BudgetedRetry._budget_tokens + elapsed * cls.BUDGET_RATE,
+            )
+            if _BudgetedRetry._budget_tokens < 1:
+                return False
+            _BudgetedRetry._budget_tokens -= 1
+            return True
+    
+    def increment(
+        self,
+        method: Optional[str] = None,
+        url: Optional[str] = None,
+        response: Optional["BaseHTTPResponse"] = None,
+        error: Optional[Exception] = None,
+        _pool: Optional["ConnectionPool"] = None,
+        _stacktrace: Optional[TracebackType] = None
+    ) -> "_BudgetedRetry":
+        # Let the base class decide first so exhausted retries don't spend tokens
+        new_retry = super().increment(
+            method=method,
+            url=url,
+            response=response,
+            error=error,
+            _pool=_pool,
+            _stacktrace=_stacktrace,
+        )
+        if not self._take_token():
+            raise MaxRetryError(
+                cast("ConnectionPool", _pool), url, error or ResponseError("retry budget exhausted")
+            )
+        return new_retry
+
+
+class _ResponseCache:
+    """Small thread-safe LRU cache with a TTL for successful API responses.
+    
+    Responses are stored as raw JSON and parsed on every hit, so callers
+    always get their own copy and can never alter what later callers see.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str], Tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of a cached response, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                return None
+            # Re-insert so frequently used entries are evicted last
+            del self._entries[key]
+            self._entries[key] = entry
+        
+        return jsonio.loads(entry[1])
+    
+    def put(self, key: Tuple[str, str], raw: bytes) -> None:
+        """Store a raw JSON response, evicting the oldest entry when full."""
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic(), raw)
+
+
+# Per-process cache so repeated lookups of the same URL skip the network
+_response_cache = _ResponseCache(maxsize=1024, ttl=60)
 
 
 class CivitAIClient:
@@ -22,26 +313,66 @@ class CivitAIClient:
         """Initialize CivitAI API client."""
         self.config = get_config()
         self.base_url = "https://civitai.com/api/v1"
+        self._pool_maxsize = POOL_MAXSIZE
+        
+        self._load_settings()
         self.session = self._create_session()
+        self._probe_session: Optional[requests.Session] = None
+    
+    def _load_settings(self) -> None:
+        """Snapshot configuration and resolve per-request settings once."""
+        self._cfg = self.config.get_all()
+        self._base_headers = self._build_base_headers()
+        self._proxies = self._get_proxies()
+        self._timeout = self._cfg.get("timeout", 60)
+        self._verify_ssl = not self._cfg.get("disable_ssl", False)
+        self._api_key = self._cfg.get("api_key") or ""
     
-    def _create_session(self) -> requests.Session:
-        """Create HTTP session with retry strategy."""
+    def refresh_config(self) -> None:
+        """Re-read configuration after settings were changed mid-run."""
+        self._load_settings()
+        for session in (self.session, self._probe_session):
+            if session is not None:
+                session.headers.pop("Authorization", None)
+                session.headers.update(self._base_headers)
+    
+    def _create_session(self, retries: bool = True) -> requests.Session:
+        """Create HTTP session with retry strategy.
+        
+        Args:
+            retries: Whether failed requests should be retried
+            
+        Returns:
+            Configured session
+        """
         session = requests.Session()
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+        # Configure retry strategy; short backoff, Retry-After honoured for 429s
+        if retries:
+            retry_strategy = _BudgetedRetry(
+                total=3,
+                backoff_factor=0.25,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+            )
+        else:
+            retry_strategy = Retry(0, read=False)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=False,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
+        # Static headers live on the session so requests only merge per-call extras
+        session.headers.update(self._base_headers)
+        
         return session
     
-    def _get_headers(self, referer: Optional[str] = None) -> Dict[str, str]:
-        """Get HTTP headers for API requests."""
+    def _build_base_headers(self) -> Dict[str, str]:
+        """Build the static HTTP headers shared by all API requests."""
         headers = {
             "Connection": "keep-alive",
             "Sec-Ch-Ua-Platform": "Windows",
@@ -49,18 +380,21 @@ class CivitAIClient:
             "Content-Type": "application/json"
         }
         
-        if referer:
-            headers['Referer'] = f"https://civitai.com/models/{referer}"
-        
-        api_key = self.config.get("api_key")
+        api_key = self._cfg.get("api_key")
         if api_key:
             headers['Authorization'] = f'Bearer {api_key}'
         
         return headers
     
+    def _get_headers(self, referer: Optional[str] = None) -> Optional[Dict[str, str]]:
+        """Get per-request HTTP headers on top of the session defaults."""
+        if referer:
+            return {'Referer': f"https://civitai.com/models/{referer}"}
+        return None
+    
     def _get_proxies(self) -> Dict[str, str]:
         """Get proxy configuration."""
-        proxy = self.config.get("proxy")
+        proxy = self._cfg.get("proxy")
         if proxy:
             return {
                 'http': proxy,
@@ -68,42 +402,66 @@ class CivitAIClient:
             }
         return {}
     
-    def _make_request(self, url: str, **kwargs) -> Union[Dict[str, Any], str]:
-        """Make HTTP request with error handling."""
+    def _make_request(self, url: str, **kwargs) -> Dict[str, Any]:
+        """Make HTTP request with error handling.
+        
+        Raises:
+            APIError: If the request fails or the response is not valid JSON
+        """
         headers = self._get_headers(kwargs.pop('referer', None))
-        proxies = self._get_proxies()
-        timeout = self.config.get("timeout", 60)
-        verify_ssl = not self.config.get("disable_ssl", False)
         
+        cache_key = (url, self._api_key)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        response = self._get(url, headers, **kwargs)
+        
+        try:
+            data = jsonio.loads(response.content)
+        except jsonio.JSONDecodeError:
+            raise APIInvalidResponse("Received invalid response from AI model service.")
+        
+        # Only successful responses are cached, so errors are never sticky
+        if isinstance(data, dict):
+            _response_cache.put(cache_key, response.content)
+        return data
+    
+    def _get(self, url: str, headers: Optional[Dict[str, str]], **kwargs) -> requests.Response:
+        """Send a GET request and translate failures into API errors.
+        
+        Raises:
+            APIError: If the request fails
+        """
         try:
             response = self.session.get(
                 url,
                 headers=headers,
-                proxies=proxies,
-                timeout=timeout,
-                verify=verify_ssl,
+                proxies=self._proxies,
+                timeout=self._timeout,
+                verify=self._verify_ssl,
                 **kwargs
             )
             response.raise_for_status()
-            
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                return "invalid_json"
-                
         except requests.exceptions.Timeout:
-            return "timeout"
+            raise APITimeout("Request timed out. Please try again.")
         except requests.exceptions.ConnectionError:
-            return "connection_error"
+            raise APIConnectionError(
+                "Failed to connect to AI model service. Check your internet connection."
+            )
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
-                return "not_found"
+                raise APINotFound("Requested resource not found.")
             elif e.response.status_code == 503:
-                return "service_unavailable"
+                raise APIServiceUnavailable("AI model service is currently unavailable.")
             else:
-                return "http_error"
-        except Exception:
-            return "unknown_error"
+                raise APIError(f"HTTP error: {e.response.status_code}")
+        except requests.exceptions.RetryError:
+            raise APIServiceUnavailable("AI model service is currently unavailable.")
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"Unknown error: {e}")
+        
+        return response
     
     def search_models(
         self,
@@ -115,7 +473,7 @@ class CivitAIClient:
         nsfw: bool = False,
         limit: int = 20,
         page: int = 1
-    ) -> Union[Dict[str, Any], str]:
+    ) -> Dict[str, Any]:
         """Search for models on CivitAI.
         
         Args:
@@ -129,7 +487,10 @@ class CivitAIClient:
             page: Page number
             
         Returns:
-            API response or error string
+            API response
+            
+        Raises:
+            APIError: If the request fails
         """
         params = {
             'limit': limit,
@@ -144,7 +505,7 @@ class CivitAIClient:
         if query:
             if "civitai.com" in query:
                 # Extract model ID from URL
-                match = re.search(r'models/(\d+)', query)
+                match = MODEL_ID_RE.search(query)
                 if match:
                     params = {'ids': match.group(1)}
             else:
@@ -153,21 +514,11 @@ class CivitAIClient:
         if base_models:
             params["baseModels"] = base_models
         
-        # Build query string
-        query_parts = []
-        for key, value in params.items():
-            if isinstance(value, list):
-                for item in value:
-                    query_parts.append((key, item))
-            else:
-                query_parts.append((key, value))
-        
-        query_string = urllib.parse.urlencode(query_parts, doseq=True, quote_via=urllib.parse.quote)
-        url = f"{self.base_url}/models?{query_string}"
+        url = f"{self.base_url}/models?{_encode_params(params)}"
         
         return self._make_request(url)
     
-    def get_model_by_id(self, model_id: int, nsfw: bool = True) -> Union[Dict[str, Any], str]:
+    def get_model_by_id(self, model_id: int, nsfw: bool = True) -> Dict[str, Any]:
         """Get model details by ID.
         
         Args:
@@ -175,42 +526,280 @@ class CivitAIClient:
             nsfw: Include NSFW content
             
         Returns:
-            API response or error string
+            API response
+            
+        Raises:
+            APIError: If the request fails
         """
-        params = {
-            'ids': model_id,
-            'nsfw': "true" if nsfw else "false"
-        }
+        return self._make_request(self._model_url(model_id, nsfw))
+    
+    def _model_url(self, model_id: int, nsfw: bool = True) -> str:
+        """Build the single-model lookup URL used by get_model_by_id."""
+        # Both values are integers/booleans, so no URL quoting is needed
+        return f"{self.base_url}/models?ids={int(model_id)}&nsfw={'true' if nsfw else 'false'}"
+    
+    def get_model_by_id_cached(self, model_id: int) -> Dict[str, Any]:
+        """Get model details by ID through the on-disk response cache.
         
-        query_string = urllib.parse.urlencode(params)
-        url = f"{self.base_url}/models?{query_string}"
+        Responses younger than ``update_cache_ttl_seconds`` are returned
+        without a request. Older ones are revalidated with ``If-None-Match``,
+        so an unchanged model costs a bodiless 304 instead of a full payload.
         
-        return self._make_request(url)
+        Args:
+            model_id: Model ID
+            
+        Returns:
+            API response
+            
+        Raises:
+            APIError: If the request fails or the ID is not an integer
+        """
+        model_id = _parse_model_id(model_id)
+        cached, etag, fresh = self._read_cached_model(model_id)
+        if fresh:
+            return cached
+        
+        headers = {}
+        if cached is not None and etag:
+            headers["If-None-Match"] = etag
+        
+        url = f"{self.base_url}/models?ids={model_id}&nsfw=true"
+        response = self._get(url, headers)
+        
+        if response.status_code == 304 and cached is not None:
+            try:
+                # Restart the TTL window; the cached body is still current
+                os.utime(self._model_cache_dir() / f"{model_id}.json")
+            except OSError:
+                pass
+            return cached
+        
+        try:
+            data = jsonio.loads(response.content)
+        except jsonio.JSONDecodeError:
+            raise APIInvalidResponse("Received invalid response from AI model service.")
+        
+        if isinstance(data, dict):
+            self._store_cached_model(model_id, response.content, response.headers.get("ETag"))
+        
+        return data
+    
+    def get_models_by_ids_cached(
+        self,
+        model_ids: List[int],
+        batch_size: int = 100
+    ) -> Dict[str, Any]:
+        """Get details for several models through the on-disk response cache.
+        
+        Models cached within ``update_cache_ttl_seconds`` are served from
+        disk. Stale entries with an ETag are revalidated one by one with
+        conditional requests, and everything else is fetched with batched
+        ``ids`` queries whose items then seed the cache.
+        
+        Args:
+            model_ids: Model IDs to fetch
+            batch_size: Maximum number of IDs per request
+            
+        Returns:
+            API-style response with the items of all requested models
+            
+        Raises:
+            APIError: If any request fails or an ID is not an integer
+        """
+        items: List[Dict[str, Any]] = []
+        revalidate: List[int] = []
+        missing: List[int] = []
+        
+        # Validate every ID before any of them becomes part of a cache path
+        for model_id in [_parse_model_id(model_id) for model_id in model_ids]:
+            cached, etag, fresh = self._read_cached_model(model_id)
+            if fresh:
+                items.extend(cached.get('items', []))
+            elif cached is not None and etag:
+                revalidate.append(model_id)
+            else:
+                missing.append(model_id)
+        
+        if revalidate:
+            max_workers = min(len(revalidate), self._pool_maxsize)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for result in executor.map(self.get_model_by_id_cached, revalidate):
+                    items.extend(result.get('items', []))
+        
+        if missing:
+            fetched = self.get_models_by_ids(missing, batch_size)['items']
+            items.extend(fetched)
+            
+            # Batch responses carry no per-model ETag, so these entries are
+            # refetched in a batch again once they go stale
+            for item in fetched:
+                if item.get('id') is not None:
+                    self._store_cached_model(item['id'], jsonio.dumps({'items': [item]}), None)
+        
+        return {'items': items}
     
-    def get_model_version(self, version_id: int) -> Union[Dict[str, Any], str]:
+    def _model_cache_dir(self) -> Path:
+        """Get the directory of the on-disk model response cache."""
+        return self.config.config_dir / "cache" / "models"
+    
+    def _read_cached_model(
+        self,
+        model_id: int
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str], bool]:
+        """Read a model response from the on-disk cache.
+        
+        Args:
+            model_id: Model ID
+            
+        Returns:
+            Tuple of (cached response or None, ETag or None, whether the
+            response is still within the cache TTL)
+        """
+        cache_dir = self._model_cache_dir()
+        body_path = cache_dir / f"{int(model_id)}.json"
+        ttl = self._cfg.get("update_cache_ttl_seconds", 3600)
+        
+        try:
+            age = time.time() - body_path.stat().st_mtime
+            cached = jsonio.loads(body_path.read_bytes())
+        except (OSError, ValueError):
+            return None, None, False
+        
+        if not isinstance(cached, dict):
+            return None, None, False
+        
+        try:
+            etag = (cache_dir / f"{int(model_id)}.etag").read_text(encoding='utf-8').strip() or None
+        except OSError:
+            etag = None
+        
+        return cached, etag, age < ttl
+    
+    def _store_cached_model(self, model_id: int, content: bytes, etag: Optional[str]) -> None:
+        """Write a model response and its ETag to the on-disk cache.
+        
+        Args:
+            model_id: Model ID
+            content: Raw JSON response body
+            etag: ETag of the response, if any
+        """
+        cache_dir = self._model_cache_dir()
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            jsonio.write_atomic(cache_dir / f"{int(model_id)}.json", content)
+            jsonio.write_atomic(cache_dir / f"{int(model_id)}.etag", (etag or "").encode('utf-8'))
+        except OSError:
+            # The cache is an optimization only; never fail the lookup
+            pass
+    
+    def get_models_by_ids(
+        self,
+        model_ids: List[int],
+        batch_size: int = 100,
+        nsfw: bool = True
+    ) -> Dict[str, Any]:
+        """Get details for several models with batched ``ids`` queries.
+        
+        Args:
+            model_ids: Model IDs to fetch
+            batch_size: Maximum number of IDs per request
+            nsfw: Include NSFW content
+            
+        Returns:
+            API-style response with the merged items of all batches
+            
+        Raises:
+            APIError: If any batch request fails
+        """
+        items: List[Dict[str, Any]] = []
+        
+        for start in range(0, len(model_ids), batch_size):
+            batch = model_ids[start:start + batch_size]
+            params = {'ids': batch, 'limit': len(batch), 'nsfw': nsfw}
+            result = self._make_request(f"{self.base_url}/models?{_encode_params(params)}")
+            batch_items = result.get('items', [])
+            items.extend(batch_items)
+            
+            # Seed single-model lookups so a later get_model_by_id for any of
+            # these models (e.g. when downloading an update) is free
+            for item in batch_items:
+                if item.get('id') is not None:
+                    _response_cache.put(
+                        (self._model_url(item['id'], nsfw), self._api_key),
+                        jsonio.dumps({'items': [item]})
+                    )
+        
+        return {'items': items}
+    
+    def get_model_version(self, version_id: int) -> Dict[str, Any]:
         """Get model version details.
         
         Args:
             version_id: Version ID
             
         Returns:
-            API response or error string
+            API response
+            
+        Raises:
+            APIError: If the request fails
         """
         url = f"{self.base_url}/model-versions/{version_id}"
         return self._make_request(url)
     
-    def get_model_by_hash(self, sha256: str) -> Union[Dict[str, Any], str]:
+    def get_model_by_hash(self, sha256: str) -> Dict[str, Any]:
         """Get model by SHA256 hash.
         
         Args:
             sha256: SHA256 hash
             
         Returns:
-            API response or error string
+            API response
+            
+        Raises:
+            APIError: If the request fails
         """
         url = f"{self.base_url}/model-versions/by-hash/{sha256}"
         return self._make_request(url)
     
+    def get_models_by_hashes(
+        self,
+        hashes: Iterable[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, APIError]]:
+        """Look up several SHA256 hashes concurrently.
+        
+        Requests share this client's session and connection pool.
+        
+        Args:
+            hashes: SHA256 hashes to look up
+            
+        Returns:
+            Tuple of (API response by resolved hash, error by hash whose
+            lookup failed). Hashes the API does not know appear in neither.
+        """
+        hashes = list(dict.fromkeys(hashes))
+        results: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, APIError] = {}
+        if not hashes:
+            return results, errors
+        
+        def lookup(sha256: str) -> Any:
+            try:
+                return self.get_model_by_hash(sha256)
+            except APINotFound:
+                return None
+            except APIError as e:
+                return e
+        
+        max_workers = min(len(hashes), self._pool_maxsize)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for sha256, result in zip(hashes, executor.map(lookup, hashes)):
+                if isinstance(result, APIError):
+                    errors[sha256] = result
+                elif result is not None:
+                    results[sha256] = result
+        
+        return results, errors
+    
     def get_download_url(self, file_url: str, model_id: Optional[int] = None) -> Optional[str]:
         """Get direct download URL for a file.
         
@@ -222,20 +811,24 @@ class CivitAIClient:
             Direct download URL or None if failed
         """
         headers = self._get_headers(model_id)
-        proxies = self._get_proxies()
-        verify_ssl = not self.config.get("disable_ssl", False)
+        
+        # The redirect probe is interactive, so it is never retried
+        if self._probe_session is None:
+            self._probe_session = self._create_session(retries=False)
         
         try:
-            response = self.session.get(
+            response = self._probe_session.get(
                 file_url,
                 headers=headers,
-                proxies=proxies,
+                proxies=self._proxies,
                 allow_redirects=False,
-                verify=verify_ssl
+                verify=self._verify_ssl
             )
             
             if 300 <= response.status_code <= 308:
-                if "login?returnUrl" in response.text and "reason=download-auth" in response.text:
+                # Byte-level match avoids decoding (and charset-sniffing) the body
+                body = response.content
+                if b"login?returnUrl" in body and b"reason=download-auth" in body:
                     return "auth_required"
                 
                 return response.headers.get("Location")
@@ -254,81 +847,142 @@ class CivitAIClient:
         Returns:
             Filtered models data
         """
-        if not self.config.get("hide_early_access", True):
+        if not self._cfg.get("hide_early_access", True):
+            return models_data
+        
+        items = models_data.get('items', ())
+        
+        # Common case: nothing would be dropped, so skip rebuilding the lists
+        if all(
+            item.get('modelVersions') and all(
+                v.get('files') and not v.get('earlyAccessDeadline')
+                for v in item['modelVersions']
+            )
+            for item in items
+        ):
             return models_data
         
         current_time = datetime.now(timezone.utc)
         filtered_items = []
         
-        for item in models_data.get('items', []):
-            versions_to_keep = []
-            
-            for version in item.get('modelVersions', []):
-                if not version.get('files'):
-                    continue
-                
-                early_access_deadline_str = version.get('earlyAccessDeadline')
-                if early_access_deadline_str:
-                    try:
-                        early_access_deadline = datetime.strptime(
-                            early_access_deadline_str, 
-                            "%Y-%m-%dT%H:%M:%S.%fZ"
-                        ).replace(tzinfo=timezone.utc)
-                        if current_time <= early_access_deadline:
-                            continue
-                    except ValueError:
-                        # If we can't parse the date, include the version
-                        pass
-                
-                versions_to_keep.append(version)
-            
-            if versions_to_keep:
-                item['modelVersions'] = versions_to_keep
-                filtered_items.append(item)
+        for item in items:
+            versions = item.get('modelVersions', ())
+            kept = [v for v in versions if _is_version_available(v, current_time)]
+            if not kept:
+                continue
+            # Only copy the item when some of its versions were dropped
+            filtered_items.append(item if len(kept) == len(versions) else {**item, 'modelVersions': kept})
         
-        models_data['items'] = filtered_items
-        return models_data
+        # Return a new dict; the original may be shared with the response cache
+        return {**models_data, 'items': filtered_items}
     
-    def search_by_hash(self, hash_value: str) -> Union[Dict[str, Any], str]:
+    def search_by_hash(self, hash_value: str) -> Dict[str, Any]:
         """Search for model by SHA256 hash.
         
         Args:
             hash_value: SHA256 hash of the model file
             
         Returns:
-            API response or error string
-        """
-        try:
-            url = f"{self.base_url}/model-versions/by-hash/{hash_value}"
-            headers = self._get_headers()
-            
-            response = self.session.get(url, headers=headers, timeout=30)
+            Model version data
             
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
-                return "Model not found with the provided hash"
-            else:
-                return f"API error: {response.status_code}"
-                
-        except Exception as e:
-            return f"Request failed: {str(e)}"
+        Raises:
+            APIError: If the request fails
+        """
+        return self._make_request(f"{self.base_url}/model-versions/by-hash/{hash_value}")
     
     @staticmethod
-    def calculate_sha256(file_path: Path, chunk_size: int = 8192) -> str:
+    def calculate_sha256(file_path: Path, chunk_size: int = 1 << 20) -> str:
         """Calculate SHA256 hash of a file.
         
         Args:
             file_path: Path to the file
-            chunk_size: Size of chunks to read at a time
+            chunk_size: Size of chunks to read at a time (buffered paths only)
             
         Returns:
             SHA256 hash as uppercase hex string
         """
-        sha256_hash = hashlib.sha256()
-        
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(chunk_size), b""):
-                sha256_hash.update(chunk)
+        with open(file_path, "rb", buffering=0) as f:
+            fd = f.fileno()
+            if hasattr(os, "posix_fadvise"):
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            
+            # Large files: overlap disk reads with hashing
+            if os.fstat(fd).st_size >= PIPELINED_HASH_THRESHOLD:
+                return _sha256_double_buffered(f, chunk_size).hexdigest().upper()
+            
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest().upper()
+            
+            # Python < 3.11: read into a reusable buffer to avoid per-chunk allocations
+            sha256_hash = hashlib.sha256()
+            buffer = memoryview(bytearray(chunk_size))
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                sha256_hash.update(buffer[:n])
         
-        return sha256_hash.hexdigest().upper()
\ No newline at end of file
+        return sha256_hash.hexdigest().upper()
+
+
+# Global client instance
+_client = None
+_client_lock = threading.Lock()
+
+# Global download session
+_download_session: Optional[requests.Session] = None
+_download_session_lock = threading.Lock()
+
+
+def get_client() -> CivitAIClient:
+    """Get global API client instance.
+    
+    Sharing one client reuses its session and connection pool across calls.
+    """
+    global _client
+    if _client is None:
+        # Worker threads may ask for the client concurrently
+        with _client_lock:
+            if _client is None:
+                _client = CivitAIClient()
+    return _client
+
+
+def get_download_session() -> requests.Session:
+    """Get the shared session used for model file and preview downloads.
+    
+    One session per process keeps connections to the download CDNs alive
+    across files, so only the first request to a host pays for the TCP and
+    TLS handshakes.
+    
+    Returns:
+        Shared requests session
+    """
+    global _download_session
+    with _download_session_lock:
+        if _download_session is None:
+            config = get_config()
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({
+                'User-Agent': 'AI-Model-CLI/1.0.0'
+            })
+            
+            # Add proxy configuration if set
+            proxy = config.get("proxy", "")
+            if proxy:
+                session.proxies = {'http': proxy, 'https': proxy}
+            
+            # Configure SSL verification
+            if config.get("disable_ssl", False):
+                session.verify = False
+                import urllib3
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            
+            _download_session = session
+        return _download_session
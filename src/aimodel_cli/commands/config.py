@@ -1,11 +1,16 @@
 """Configuration command implementation."""
 
+import math
+
 import click
 from rich.console import Console
 from rich.table import Table
 
 from ..config import get_config
-from ..utils import print_success, print_error, print_info
+from ..constants import MODEL_TYPES, MODEL_TYPES_SET
+from ..utils import print_success, print_error, print_info, mask_secret
+
+_VALID_MODEL_TYPES_HELP = f"Valid types: {', '.join(MODEL_TYPES)}"
 
 
 @click.group()
@@ -29,7 +34,7 @@ def list_config() -> None:
         # Hide sensitive values
         if 'key' in key.lower() or 'secret' in key.lower():
             if value:
-                display_value = f"{'*' * (len(str(value)) - 4)}{str(value)[-4:]}"
+                display_value = mask_secret(value)
             else:
                 display_value = "(not set)"
         else:
@@ -54,7 +59,7 @@ def get_config_value(key: str) -> None:
     # Hide sensitive values
     if 'key' in key.lower() or 'secret' in key.lower():
         if value:
-            display_value = f"{'*' * (len(str(value)) - 4)}{str(value)[-4:]}"
+            display_value = mask_secret(value)
         else:
             display_value = "(not set)"
     else:
@@ -71,12 +76,21 @@ def set_config_value(key: str, value: str) -> None:
     config_obj = get_config()
     
     # Convert string values to appropriate types
-    if value.lower() in ('true', 'false'):
-        value = value.lower() == 'true'
-    elif value.isdigit():
-        value = int(value)
-    elif value.replace('.', '').isdigit():
-        value = float(value)
+    # Underscore digit separators and nan/inf stay plain strings
+    lowered = value.lower()
+    if lowered in ('true', 'false'):
+        value = lowered == 'true'
+    elif '_' not in value:
+        try:
+            value = int(value)
+        except ValueError:
+            try:
+                number = float(value)
+            except ValueError:
+                pass
+            else:
+                if math.isfinite(number):
+                    value = number
     
     config_obj.set(key, value)
     print_success(f"Set {key} = {value}")
@@ -112,7 +126,7 @@ def set_api_key(api_key: str, show: bool) -> None:
     if show:
         current_key = config_obj.get('api_key', '')
         if current_key:
-            masked_key = f"{'*' * (len(current_key) - 4)}{current_key[-4:]}"
+            masked_key = mask_secret(current_key)
             print_info(f"Current API key: {masked_key}")
         else:
             print_info("No API key configured.")
@@ -195,15 +209,9 @@ def set_model_path(model_type: str, path: str) -> None:
     config_obj = get_config()
     
     # Validate model type
-    valid_types = [
-        "Checkpoint", "TextualInversion", "LORA", "LoCon", "DoRA",
-        "Hypernetwork", "AestheticGradient", "Controlnet", "Poses",
-        "VAE", "Upscaler", "MotionModule", "Wildcards", "Workflows", "Other"
-    ]
-    
-    if model_type not in valid_types:
+    if model_type not in MODEL_TYPES_SET:
         print_error(f"Invalid model type: {model_type}")
-        print_info(f"Valid types: {', '.join(valid_types)}")
+        print_info(_VALID_MODEL_TYPES_HELP)
         return
     
     if path is None:
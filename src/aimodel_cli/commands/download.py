@@ -1,16 +1,20 @@
 """Download command implementation."""
 
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, TaskID
 
-from ..api import CivitAIClient
+from ..api import APIError, APINotFound, get_client
+from ..constants import MODEL_ID_RE
 from ..download import download_model_by_id, DownloadError
 from ..utils import print_error, print_success, format_model_versions, format_version_files
 from ..config import get_config
 
+# Only needed for annotations; rich.progress itself is imported on first use
+if TYPE_CHECKING:
+    from rich.progress import TaskID
+
 
 @click.command()
 @click.argument('model_id', type=int)
@@ -39,25 +43,36 @@ def download(
         aimodel download 123456 --path ./my-models
         aimodel download 123456 --show-versions
     """
-    client = CivitAIClient()
+    _do_download(model_id, version, file_id, path, show_versions, show_files)
+
+
+def _do_download(
+    model_id: int,
+    version: Optional[int],
+    file_id: Optional[int],
+    path: Optional[Path],
+    show_versions: bool,
+    show_files: bool
+) -> None:
+    """Fetch model information and download or list its versions/files."""
+    # Imported lazily so unrelated commands don't pay for rich.progress at startup
+    from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
     
-    # Get model information
-    with Progress(
-        TextColumn("[progress.description]"),
-        transient=True,
-    ) as progress:
-        progress.add_task(description="Fetching model information...", total=None)
-        model_data = client.get_model_by_id(model_id)
+    client = get_client()
     
-    if isinstance(model_data, str):
-        error_messages = {
-            'timeout': 'Request timed out. Please try again.',
-            'connection_error': 'Failed to connect to AI model service. Check your internet connection.',
-            'not_found': f'Model {model_id} not found.',
-            'service_unavailable': 'AI model service is currently unavailable.',
-            'invalid_json': 'Received invalid response from AI model service.',
-        }
-        print_error(error_messages.get(model_data, f'Unknown error: {model_data}'))
+    # Get model information
+    try:
+        with Progress(
+            TextColumn("[progress.description]"),
+            transient=True,
+        ) as progress:
+            progress.add_task(description="Fetching model information...", total=None)
+            model_data = client.get_model_by_id(model_id)
+    except APINotFound:
+        print_error(f"Model {model_id} not found.")
+        return
+    except APIError as e:
+        print_error(str(e))
         return
     
     if not model_data.get('items'):
@@ -136,24 +151,17 @@ def download_url(url: str, path: Optional[Path]) -> None:
     Examples:
         aimodel download-url "https://civitai.com/models/123456"
     """
-    import re
-    
     # Extract model ID from URL
-    match = re.search(r'models/(\d+)', url)
+    match = MODEL_ID_RE.search(url)
     if not match:
         print_error("Invalid CivitAI URL. Expected format: https://civitai.com/models/123456")
         return
     
-    model_id = int(match.group(1))
-    
-    # Use the download command with extracted ID
-    from click.testing import CliRunner
-    runner = CliRunner()
-    
-    cmd_args = [str(model_id)]
-    if path:
-        cmd_args.extend(['--path', str(path)])
-    
-    result = runner.invoke(download, cmd_args, standalone_mode=False)
-    if result.exception:
-        raise result.exception
\ No newline at end of file
+    _do_download(
+        model_id=int(match.group(1)),
+        version=None,
+        file_id=None,
+        path=path,
+        show_versions=False,
+        show_files=False
+    )
\ No newline at end of file
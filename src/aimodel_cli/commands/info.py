@@ -4,9 +4,9 @@ from pathlib import Path
 from typing import Optional
 
 import click
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from ..api import CivitAIClient
+from ..api import APIError, APINotFound, get_client
+from ..constants import MODEL_ID_RE
 from ..models import ModelInfo
 from ..utils import format_model_info, print_error, print_info
 
@@ -72,8 +72,7 @@ def info(target: str, local: bool) -> None:
     if target.isdigit():
         model_id = int(target)
     elif 'civitai.com' in target:
-        import re
-        match = re.search(r'models/(\d+)', target)
+        match = MODEL_ID_RE.search(target)
         if match:
             model_id = int(match.group(1))
         else:
@@ -84,25 +83,23 @@ def info(target: str, local: bool) -> None:
         return
     
     # Fetch model info from API
-    client = CivitAIClient()
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        transient=True,
-    ) as progress:
-        progress.add_task(description="Fetching model information...", total=None)
-        result = client.get_model_by_id(model_id)
+    client = get_client()
     
-    if isinstance(result, str):
-        error_messages = {
-            'timeout': 'Request timed out. Please try again.',
-            'connection_error': 'Failed to connect to AI model service. Check your internet connection.',
-            'not_found': f'Model {model_id} not found.',
-            'service_unavailable': 'AI model service is currently unavailable.',
-            'invalid_json': 'Received invalid response from AI model service.',
-        }
-        print_error(error_messages.get(result, f'Unknown error: {result}'))
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            transient=True,
+        ) as progress:
+            progress.add_task(description="Fetching model information...", total=None)
+            result = client.get_model_by_id(model_id)
+    except APINotFound:
+        print_error(f"Model {model_id} not found.")
+        return
+    except APIError as e:
+        print_error(str(e))
         return
     
     # Display model info
@@ -1,16 +1,19 @@
 """Metadata and preview completion command implementation."""
 
+import os
 import click
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from rich.console import Console
 from rich.progress import Progress, TaskID, TextColumn, BarColumn, TimeRemainingColumn
 
-from ..api import CivitAIClient
+from ..api import CivitAIClient, get_client, APIError, APINotFound
 from ..config import get_config
-from ..models import ModelInfo
-from ..utils import print_success, print_error, print_warning, print_info
+from ..constants import MODEL_TYPES, MODEL_TYPES_SET, MODEL_FILE_SUFFIXES, is_model_filename
+from ..models import ModelInfo, bulk_hash, get_hash_cache, save_version_previews
+from ..utils import print_success, print_error, print_warning, print_info, progress_enabled
 
 
 @click.group()
@@ -82,21 +85,15 @@ def complete_metadata(
         # Use config default
         use_recursive = config.get("metadata_recursive_default", False)
     
-    client = CivitAIClient()
+    client = get_client()
     console = Console()
     
     # Determine target path
     if model_type:
         # Validate model type
-        valid_types = [
-            "Checkpoint", "TextualInversion", "LORA", "LoCon", "DoRA",
-            "Hypernetwork", "AestheticGradient", "Controlnet", "Poses",
-            "VAE", "Upscaler", "MotionModule", "Wildcards", "Workflows", "Other"
-        ]
-        
-        if model_type not in valid_types:
+        if model_type not in MODEL_TYPES_SET:
             print_error(f"Invalid model type: {model_type}")
-            print_info(f"Valid types: {', '.join(valid_types)}")
+            print_info(f"Valid types: {', '.join(MODEL_TYPES)}")
             return
         
         target_path = config.get_model_path(model_type)
@@ -120,43 +117,118 @@ def complete_metadata(
     else:
         model_files = _find_model_files(target_path, use_recursive)
     
+    if target_path.is_dir():
+        # Forget hashes of files that were deleted or moved since the last scan
+        get_hash_cache().prune(target_path)
+    
     if not model_files:
         print_warning("No model files found")
         return
     
     print_info(f"Found {len(model_files)} model files")
     
+    success_count = 0
+    error_count = 0
+    skipped_count = 0
+    
+    # Snapshot which outputs exist before hashing, since hashing writes the
+    # sidecar JSON. Each directory is listed once instead of stat'ing every
+    # sidecar, so complete files are dropped before any per-file work.
+    listings = _list_parent_directories(model_files)
+    existing: Dict[Path, Tuple[bool, bool]] = {}
+    hashes: Dict[Path, str] = {}
+    to_hash = []
+    for model_file in model_files:
+        names = listings[model_file.parent]
+        stem = model_file.stem
+        json_exists = f"{stem}.json" in names
+        preview_exists = f"{stem}.preview.png" in names
+        if _should_skip(json_exists, preview_exists, force, metadata_only, preview_only):
+            skipped_count += 1
+            continue
+        existing[model_file] = (json_exists, preview_exists)
+        cached_hash = ModelInfo(model_file).get_cached_sha256() if json_exists else None
+        if cached_hash:
+            hashes[model_file] = cached_hash
+        else:
+            to_hash.append(model_file)
+    
     with Progress(
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
-        console=console
+        console=console,
+        refresh_per_second=10,
+        disable=not progress_enabled()
     ) as progress:
-        task = progress.add_task("Processing models...", total=len(model_files))
+        # Hash across processes first so several cores hash separate files at once
+        if len(to_hash) > 1:
+            hash_task = progress.add_task("Hashing models...", total=len(to_hash))
+            # Failures are left for _process_single_file to retry and report
+            # Preview-only runs must leave the JSON files untouched
+            for model_file, file_hash in bulk_hash(to_hash, save_to_json=not preview_only):
+                if file_hash:
+                    hashes[model_file] = file_hash
+                progress.advance(hash_task)
+        
+        # Resolve all known hashes up front, concurrently over the shared session,
+        # so the per-file stage below is purely local work plus previews
+        lookups: Dict[str, Dict[str, Any]] = {}
+        lookup_errors: Dict[str, APIError] = {}
+        if hashes:
+            lookup_task = progress.add_task("Looking up models...", total=None)
+            lookups, lookup_errors = client.get_models_by_hashes(hashes.values())
+            progress.update(lookup_task, total=1, completed=1)
         
-        success_count = 0
-        error_count = 0
-        skipped_count = 0
+        task = progress.add_task("Processing models...", total=len(model_files))
+        progress.advance(task, skipped_count)
         
-        for model_file in model_files:
-            progress.update(task, description=f"Processing {model_file.name}")
+        # Metadata writes overlap across files; the worker count bounds concurrent
+        # requests, and the progress bar is only touched here. Previews are queued
+        # for a separate download stage.
+        preview_jobs: List[Tuple[ModelInfo, Dict[str, Any]]] = []
+        max_workers = max(1, int(config.get("metadata_workers", 8)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _process_single_file,
+                    model_file, client, force, metadata_only, preview_only,
+                    hashes.get(model_file), file_state, lookups, preview_jobs,
+                    lookup_errors
+                ): model_file
+                for model_file, file_state in existing.items()
+            }
             
-            try:
-                result = _process_single_file(
-                    model_file, client, force, metadata_only, preview_only
-                )
+            total = len(futures)
+            for done, future in enumerate(as_completed(futures), 1):
+                model_file = futures[future]
                 
-                if result == "success":
-                    success_count += 1
-                elif result == "skipped":
-                    skipped_count += 1
-                else:
-                    error_count += 1
+                # Refresh the description in batches rather than per file
+                if done % 50 == 0 or done == total:
+                    progress.update(task, description=f"Processing ({done}/{total})")
+                
+                try:
+                    result = future.result()
                     
-            except Exception as e:
-                print_error(f"Error processing {model_file.name}: {e}")
-                error_count += 1
-            
-            progress.advance(task)
+                    if result == "success":
+                        success_count += 1
+                    elif result == "skipped":
+                        skipped_count += 1
+                    else:
+                        error_count += 1
+                        
+                except Exception as e:
+                    print_error(f"Error processing {model_file.name}: {e}")
+                    error_count += 1
+                
+                progress.advance(task)
+        
+        if preview_jobs:
+            preview_task = progress.add_task("Downloading previews...", total=len(preview_jobs))
+            for model_info, _, error in save_version_previews(preview_jobs):
+                if error is not None:
+                    # Preview failure is not critical
+                    print_warning(f"Failed to save preview for {model_info.file_path.name}: {error}")
+                progress.advance(preview_task)
     
     # Summary
     console.print()
@@ -186,10 +258,10 @@ def calculate_hash(file_path: Path) -> None:
         model_info = ModelInfo(file_path)
         
         # Check if hash is already cached
-        existing_data = model_info.load_from_json()
-        if 'sha256' in existing_data and existing_data['sha256']:
+        cached_hash = model_info.get_cached_sha256()
+        if cached_hash:
             print_info("Using cached SHA256 hash...")
-            hash_value = existing_data['sha256']
+            hash_value = cached_hash
         else:
             print_info("Calculating SHA256 hash...")
             hash_value = model_info.generate_sha256()
@@ -200,55 +272,128 @@ def calculate_hash(file_path: Path) -> None:
         print_error(f"Failed to calculate hash: {e}")
 
 
+def _list_parent_directories(files: List[Path]) -> Dict[Path, Set[str]]:
+    """List each distinct parent directory of the given files once.
+    
+    Args:
+        files: File paths
+        
+    Returns:
+        Dictionary mapping each parent directory to its entry names
+    """
+    listings: Dict[Path, Set[str]] = {}
+    for file_path in files:
+        parent = file_path.parent
+        if parent not in listings:
+            try:
+                listings[parent] = set(os.listdir(parent))
+            except OSError:
+                listings[parent] = set()
+    return listings
+
+
+def _should_skip(
+    json_exists: bool,
+    preview_exists: bool,
+    force: bool,
+    metadata_only: bool,
+    preview_only: bool
+) -> bool:
+    """Check whether the requested outputs for a model already exist."""
+    if force:
+        return False
+    if metadata_only:
+        return json_exists
+    if preview_only:
+        return preview_exists
+    return json_exists and preview_exists
+
+
 def _process_single_file(
     model_file: Path,
     client: CivitAIClient,
     force: bool,
     metadata_only: bool,
-    preview_only: bool
+    preview_only: bool,
+    file_hash: Optional[str] = None,
+    existing: Optional[Tuple[bool, bool]] = None,
+    lookups: Optional[Dict[str, Dict[str, Any]]] = None,
+    preview_jobs: Optional[List[Tuple[ModelInfo, Dict[str, Any]]]] = None,
+    lookup_errors: Optional[Dict[str, APIError]] = None
 ) -> str:
     """Process a single model file.
     
+    Args:
+        model_file: Path to the model file
+        client: API client
+        force: Overwrite existing metadata and previews
+        metadata_only: Only save metadata
+        preview_only: Only save the preview image
+        file_hash: Precomputed SHA256 hash, if already known
+        existing: (json_exists, preview_exists) snapshot taken before hashing
+        lookups: Batched hash lookup results covering file_hash; a missing
+            entry means the hash could not be resolved
+        preview_jobs: If given, previews are appended here for the caller to
+            download instead of being downloaded immediately
+        lookup_errors: Errors of batched hash lookups that failed, by hash
+        
     Returns:
         "success", "skipped", or "error"
     """
     model_info = ModelInfo(model_file)
     
     # Check if files already exist
-    json_exists = model_info.json_path.exists()
-    preview_exists = model_info.preview_path.exists()
-    
-    if not force:
-        if metadata_only and json_exists:
-            return "skipped"
-        if preview_only and preview_exists:
-            return "skipped"
-        if not metadata_only and not preview_only and json_exists and preview_exists:
-            return "skipped"
-    
-    # Calculate hash (uses cached value if available)
-    try:
-        file_hash = model_info.generate_sha256()
-    except Exception as e:
-        print_error(f"Failed to calculate hash for {model_file.name}: {e}")
-        return "error"
-    
-    # Search by hash
-    hash_result = client.search_by_hash(file_hash)
-    if isinstance(hash_result, str):
-        print_warning(f"Could not find model info for {model_file.name}: {hash_result}")
-        return "error"
-    
-    # Extract model data for metadata saving
-    model_data = _convert_version_to_model_data(hash_result)
+    if existing is not None:
+        json_exists, preview_exists = existing
+    else:
+        json_exists = model_info.json_path.exists()
+        preview_exists = model_info.preview_path.exists()
+    
+    if _should_skip(json_exists, preview_exists, force, metadata_only, preview_only):
+        return "skipped"
+    
+    if lookups is not None and file_hash:
+        # The caller already looked this hash up as part of a batch
+        hash_result = lookups.get(file_hash)
+        if hash_result is None:
+            error = (lookup_errors or {}).get(file_hash)
+            if error is not None:
+                print_error(f"Failed to look up model info for {model_file.name}: {error}")
+            else:
+                print_warning(f"Could not find model info for {model_file.name}: Model not found with the provided hash")
+            return "error"
+    else:
+        # Prefer the hash cached in the sidecar JSON over re-reading the model file
+        if not file_hash and json_exists:
+            file_hash = model_info.get_cached_sha256()
+        
+        if not file_hash:
+            try:
+                file_hash = model_info.generate_sha256(save_to_json=not preview_only)
+            except Exception as e:
+                print_error(f"Failed to calculate hash for {model_file.name}: {e}")
+                return "error"
+        
+        # Search by hash
+        try:
+            hash_result = client.search_by_hash(file_hash)
+        except APINotFound:
+            print_warning(f"Could not find model info for {model_file.name}: Model not found with the provided hash")
+            return "error"
+        except APIError as e:
+            print_warning(f"Could not find model info for {model_file.name}: {e}")
+            return "error"
+    
+    # The hash lookup returns version data with a summary of its parent model
+    model_meta = hash_result.get("model", {})
     
     success = True
     
     # Save metadata
-    if not metadata_only or not preview_only:
+    if not preview_only:
         if force or not json_exists:
             try:
-                model_info.save_model_metadata(model_data, file_hash)
+                model_info.save_version_metadata(model_meta, hash_result)
             except Exception as e:
                 print_error(f"Failed to save metadata for {model_file.name}: {e}")
                 success = False
@@ -256,56 +401,50 @@ def _process_single_file(
     # Save preview
     if not metadata_only:
         if force or not preview_exists:
-            try:
-                model_info.save_preview_image(model_data, file_hash)
-            except Exception as e:
-                print_warning(f"Failed to save preview for {model_file.name}: {e}")
-                # Preview failure is not critical
+            if preview_jobs is not None:
+                preview_jobs.append((model_info, hash_result))
+            else:
+                _save_preview(model_info, hash_result)
     
     return "success" if success else "error"
 
 
-def _convert_version_to_model_data(version_data: dict) -> dict:
-    """Convert API version response to model data format.
-    
-    Args:
-        version_data: Version data from hash search
-        
-    Returns:
-        Model data in expected format
-    """
-    # The hash search returns version data, we need to construct model data format
-    model_data = {
-        "items": [{
-            "id": version_data.get("modelId"),
-            "name": version_data.get("model", {}).get("name", "Unknown"),
-            "type": version_data.get("model", {}).get("type", "Unknown"),
-            "nsfw": version_data.get("model", {}).get("nsfw", False),
-            "description": version_data.get("model", {}).get("description", ""),
-            "modelVersions": [version_data]
-        }]
-    }
-    
-    return model_data
+def _save_preview(model_info: ModelInfo, version_data: Dict[str, Any]) -> None:
+    """Download the preview image for a model version."""
+    try:
+        model_info.save_version_preview(version_data)
+    except Exception as e:
+        print_warning(f"Failed to save preview for {model_info.file_path.name}: {e}")
+        # Preview failure is not critical
 
 
-def _is_model_file(file_path: Path) -> bool:
+def _is_model_file(file_path: Union[Path, str]) -> bool:
     """Check if file is a supported model file."""
-    supported_extensions = {'.safetensors', '.pt', '.pth', '.ckpt', '.bin'}
-    return file_path.suffix.lower() in supported_extensions
+    return is_model_filename(file_path.name if isinstance(file_path, Path) else file_path)
 
 
 def _find_model_files(directory: Path, recursive: bool) -> List[Path]:
     """Find all model files in directory."""
     model_files = []
-    
-    pattern = "**/*" if recursive else "*"
-    
-    for file_path in directory.glob(pattern):
-        if file_path.is_file() and _is_model_file(file_path):
-            model_files.append(file_path)
-    
-    return sorted(model_files)
+    stack = [os.fspath(directory)]
+    
+    # scandir exposes cached entry types, so most entries need no extra stat
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.name.lower().endswith(MODEL_FILE_SUFFIXES) and entry.is_file():
+                        model_files.append(Path(entry.path))
+        except OSError:
+            # Unreadable directories are skipped, as glob() did
+            continue
+    
+    model_files.sort()
+    return model_files
 
 
 # Add commands to the group
@@ -3,36 +3,26 @@
 from typing import List, Optional
 
 import click
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from ..api import CivitAIClient
-from ..utils import format_search_results, print_error
+from ..api import get_client, APIError, APINotFound
+from ..constants import MODEL_TYPES, BASE_MODELS, SORT_OPTIONS, PERIODS
+from ..utils import format_search_results, print_error, progress_enabled
 
 
 @click.command()
 @click.argument('query', required=False)
 @click.option('--type', 'content_types', multiple=True, 
-              type=click.Choice([
-                  'Checkpoint', 'TextualInversion', 'LORA', 'LoCon', 'DoRA',
-                  'Hypernetwork', 'AestheticGradient', 'Controlnet', 'Poses',
-                  'VAE', 'Upscaler', 'MotionModule', 'Wildcards', 'Workflows', 'Other'
-              ]),
+              type=click.Choice(MODEL_TYPES),
               help='Filter by content type(s)')
 @click.option('--base-model', 'base_models', multiple=True,
-              type=click.Choice([
-                  'SD 1.4', 'SD 1.5', 'SD 2.0', 'SD 2.1', 'SDXL 1.0', 'SDXL Turbo',
-                  'Stable Cascade', 'Pony', 'Flux.1 D', 'Flux.1 S', 'Other'
-              ]),
+              type=click.Choice(BASE_MODELS),
               help='Filter by base model(s)')
 @click.option('--sort', 'sort_by', 
-              type=click.Choice([
-                  'Newest', 'Oldest', 'Most Downloaded', 'Highest Rated',
-                  'Most Liked', 'Most Buzz', 'Most Discussed', 'Most Collected', 'Most Images'
-              ]),
+              type=click.Choice(SORT_OPTIONS),
               default='Most Downloaded',
               help='Sort order')
 @click.option('--period',
-              type=click.Choice(['All Time', 'Year', 'Month', 'Week', 'Day']),
+              type=click.Choice(PERIODS),
               default='All Time',
               help='Time period for sorting')
 @click.option('--nsfw', is_flag=True, default=False,
@@ -75,35 +65,34 @@ def search(
         # Include NSFW content
         aimodel search "artistic style" --nsfw --type LORA
     """
-    client = CivitAIClient()
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        transient=True,
-    ) as progress:
-        progress.add_task(description="Searching...", total=None)
-        
-        result = client.search_models(
-            query=query,
-            content_types=list(content_types) if content_types else None,
-            base_models=list(base_models) if base_models else None,
-            sort_by=sort_by,
-            period=period,
-            nsfw=nsfw,
-            limit=limit,
-            page=page
-        )
+    client = get_client()
     
-    if isinstance(result, str):
-        error_messages = {
-            'timeout': 'Request timed out. Please try again.',
-            'connection_error': 'Failed to connect to AI model service. Check your internet connection.',
-            'not_found': 'No results found.',
-            'service_unavailable': 'AI model service is currently unavailable.',
-            'invalid_json': 'Received invalid response from AI model service.',
-        }
-        print_error(error_messages.get(result, f'Unknown error: {result}'))
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            transient=True,
+            disable=not progress_enabled(),
+        ) as progress:
+            progress.add_task(description="Searching...", total=None)
+            
+            result = client.search_models(
+                query=query,
+                content_types=list(content_types) if content_types else None,
+                base_models=list(base_models) if base_models else None,
+                sort_by=sort_by,
+                period=period,
+                nsfw=nsfw,
+                limit=limit,
+                page=page
+            )
+    except APINotFound:
+        print_error("No results found.")
+        return
+    except APIError as e:
+        print_error(str(e))
         return
     
     # Filter early access models
@@ -1,19 +1,34 @@
 """Model update checking command implementation."""
 
-import json
+import os
+import time
 import click
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 from datetime import datetime
 
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, BarColumn, TextColumn
-
-from ..api import CivitAIClient
+from .. import jsonio
+from ..api import CivitAIClient, APIError, get_client
 from ..config import get_config
-from ..models import ModelInfo
-from ..utils import print_success, print_error, print_warning, print_info, safe_str, generate_update_report
+from ..constants import MODEL_TYPES, MODEL_TYPES_SET, MODEL_FILE_SUFFIXES, is_model_filename
+from ..utils import (
+    print_success, print_error, print_warning, print_info, safe_str, generate_update_report, progress_enabled
+)
+
+try:
+    # C parser that understands the API's trailing 'Z' without a string copy
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:
+    def _parse_dt(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Update tables longer than the threshold are printed in pages
+UPDATE_TABLE_PAGINATE_THRESHOLD = 200
+UPDATE_TABLE_PAGE_SIZE = 100
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 @click.group()
@@ -83,20 +98,18 @@ def check_updates(
     else:
         use_recursive = config.get("metadata_recursive_default", False)
     
-    client = CivitAIClient()
+    # Imported lazily so other commands don't pay for rich.progress at startup
+    from rich.console import Console
+    from rich.progress import Progress, BarColumn, TextColumn
+    
+    client = get_client()
     console = Console()
     
     # Determine target path
     if model_type:
-        valid_types = [
-            "Checkpoint", "TextualInversion", "LORA", "LoCon", "DoRA",
-            "Hypernetwork", "AestheticGradient", "Controlnet", "Poses",
-            "VAE", "Upscaler", "MotionModule", "Wildcards", "Workflows", "Other"
-        ]
-        
-        if model_type not in valid_types:
+        if model_type not in MODEL_TYPES_SET:
             print_error(f"Invalid model type: {model_type}")
-            print_info(f"Valid types: {', '.join(valid_types)}")
+            print_info(f"Valid types: {', '.join(MODEL_TYPES)}")
             return
         
         target_path = config.get_model_path(model_type)
@@ -108,37 +121,66 @@ def check_updates(
     else:
         target_path = path
     
-    # Find model files with metadata
-    model_files = _find_models_with_metadata(target_path, use_recursive)
+    # Find model files with metadata; each sidecar is parsed at most once here,
+    # and not at all when it is unchanged since the last scan
+    errors = []
+    meta_cache = _LocalMetaCache(config.config_dir / "cache" / "local-meta.json")
+    local_models = list(_iter_models_with_metadata(target_path, use_recursive, errors, meta_cache))
+    meta_cache.save(target_path, use_recursive)
     
-    if not model_files:
+    if not local_models and not errors:
         print_warning("No models with metadata found")
         print_info("Use 'aimodel metadata complete' to generate metadata for existing models")
         return
     
-    print_info(f"Found {len(model_files)} models with metadata")
+    total_checked = len(local_models) + len(errors)
+    print_info(f"Found {total_checked} models with metadata")
+    
+    updates_available = []
+    up_to_date = []
     
     # Check for updates
     with Progress(
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
-        console=console
+        console=console,
+        refresh_per_second=10,
+        transient=True,
+        disable=not progress_enabled()
     ) as progress:
-        task = progress.add_task("Checking for updates...", total=len(model_files))
+        model_ids = list(dict.fromkeys(str(metadata['modelId']) for _, metadata in local_models))
+        fetch_task = progress.add_task("Fetching model information...", total=len(model_ids))
+        max_workers = max(1, int(config.get("update_concurrency", 16)))
+        model_items, fetch_errors = _fetch_models(
+            client,
+            model_ids,
+            max_workers,
+            on_batch=lambda count: progress.advance(fetch_task, count)
+        )
         
-        updates_available = []
-        up_to_date = []
-        errors = []
+        task = progress.add_task("Checking for updates...", total=len(local_models))
+        last_desc = 0.0
         
-        for model_file in model_files:
-            progress.update(task, description=f"Checking {model_file.name}")
+        for model_file, metadata in local_models:
+            model_id = str(metadata['modelId'])
+            
+            # Re-rendering the description per file is costly on large scans
+            now = time.monotonic()
+            if now - last_desc > 0.1:
+                progress.update(task, description=f"Checking {safe_str(model_file.name)}")
+                last_desc = now
             
             try:
-                update_info = _check_model_update(model_file, client)
+                if model_id in fetch_errors:
+                    raise Exception(f"Failed to get model info: {fetch_errors[model_id]}")
+                if model_id not in model_items:
+                    raise Exception("Model not found on CivitAI")
+                
+                update_info = _compare_versions(model_file, metadata, model_items[model_id])
                 
                 if update_info["has_update"]:
                     updates_available.append(update_info)
-                elif show_all:
+                else:
                     up_to_date.append(update_info)
                     
             except Exception as e:
@@ -146,8 +188,13 @@ def check_updates(
             
             progress.advance(task)
     
+    # Discovery order is arbitrary, so results are ordered only once here
+    updates_available.sort(key=_result_sort_key)
+    up_to_date.sort(key=_result_sort_key)
+    errors.sort(key=lambda e: e["file"])
+    
     # Display results
-    _display_update_results(updates_available, up_to_date, errors, show_all, console)
+    _display_update_results(updates_available, up_to_date, errors, show_all, console, total_checked)
     
     # Generate report if requested
     if report:
@@ -177,7 +224,7 @@ def download_update(model_file: Path, version: Optional[str]) -> None:
         print_error(f"File {model_file} is not a supported model file")
         return
     
-    client = CivitAIClient()
+    client = get_client()
     
     try:
         update_info = _check_model_update(model_file, client)
@@ -221,59 +268,318 @@ def download_update(model_file: Path, version: Optional[str]) -> None:
         print_error(f"Failed to check/download update: {e}")
 
 
-def _find_models_with_metadata(directory: Path, recursive: bool) -> List[Path]:
-    """Find all model files that have associated metadata."""
-    model_files = []
+class _LocalMetaCache:
+    """Model and version IDs of local metadata files, keyed by file stat.
     
-    pattern = "**/*" if recursive else "*"
+    Update checks only need the two IDs from each sidecar, so an unchanged
+    sidecar can be skipped entirely on later scans. The cache is shared by
+    all scanned directories, so saving only drops stale entries from the
+    directory that was just scanned.
+    """
     
-    for file_path in directory.glob(pattern):
-        if file_path.is_file() and _is_model_file(file_path):
-            # Check if metadata file exists
-            json_path = file_path.with_suffix('.json')
-            if json_path.exists():
-                model_files.append(file_path)
+    def __init__(self, path: Path):
+        """Initialize the cache and load previous entries.
+        
+        Args:
+            path: Cache file location
+        """
+        self.path = path
+        self._dirty = False
+        self._seen: Set[str] = set()
+        try:
+            self._entries: Dict[str, List[Any]] = jsonio.loads(path.read_bytes())
+        except (OSError, ValueError):
+            self._entries = {}
+        if not isinstance(self._entries, dict):
+            self._entries = {}
+    
+    def get(self, json_path: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Return cached IDs if the metadata file is unchanged."""
+        key = os.path.abspath(json_path)
+        entry = self._entries.get(key)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            self._seen.add(key)
+            return {"modelId": entry[2], "modelVersionId": entry[3]}
+        return None
+    
+    def put(self, json_path: str, stat: os.stat_result, metadata: Dict[str, Any]) -> None:
+        """Remember the IDs of a freshly parsed metadata file."""
+        key = os.path.abspath(json_path)
+        self._entries[key] = [
+            stat.st_mtime_ns, stat.st_size, metadata.get('modelId'), metadata.get('modelVersionId')
+        ]
+        self._seen.add(key)
+        self._dirty = True
     
-    return sorted(model_files)
+    def save(self, directory: Path, recursive: bool) -> None:
+        """Prune stale entries of a scanned directory and write back changes.
+        
+        Entries in the scanned part of the directory that this scan did not
+        see are dropped, as are entries below it whose file no longer exists.
+        Entries of other directories are kept.
+        
+        Args:
+            directory: Directory that was scanned
+            recursive: Whether the scan included subdirectories
+        """
+        root = os.path.abspath(directory)
+        prefix = os.path.join(root, "")
+        stale = [
+            key for key in self._entries
+            if key.startswith(prefix) and key not in self._seen and (
+                recursive or os.path.dirname(key) == root or not os.path.exists(key)
+            )
+        ]
+        if stale:
+            for key in stale:
+                del self._entries[key]
+            self._dirty = True
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            jsonio.dump_atomic(self._entries, self.path)
+            self._dirty = False
+        except OSError:
+            # The cache is an optimization only; never fail the scan
+            pass
 
 
-def _is_model_file(file_path: Path) -> bool:
-    """Check if file is a supported model file."""
-    supported_extensions = {'.safetensors', '.pt', '.pth', '.ckpt', '.bin'}
-    return file_path.suffix.lower() in supported_extensions
+def _iter_models_with_metadata(
+    directory: Path,
+    recursive: bool,
+    errors: List[Dict[str, Any]],
+    meta_cache: Optional[_LocalMetaCache] = None
+) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+    """Find all model files that have associated metadata and load it.
+    
+    Each metadata file is opened and parsed once during discovery so later
+    stages never have to touch it again. Files are yielded in directory
+    order; callers sort results if they need a stable order.
+    
+    Args:
+        directory: Directory to scan
+        recursive: Whether to descend into subdirectories
+        errors: List that metadata load errors are appended to
+        meta_cache: Optional cache used to skip unchanged metadata files;
+            cached entries only carry ``modelId`` and ``modelVersionId``
+        
+    Yields:
+        Tuples of (model file, metadata)
+    """
+    for file_path, json_path in _iter_models(directory, recursive):
+        try:
+            if meta_cache is not None:
+                stat = os.stat(json_path)
+                cached = meta_cache.get(json_path, stat)
+                if cached is not None:
+                    yield file_path, cached
+                    continue
+            
+            with open(json_path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            errors.append({"file": file_path, "error": str(e)})
+            continue
+        
+        try:
+            metadata = _load_model_metadata(file_path, jsonio.loads(raw))
+        except Exception as e:
+            errors.append({"file": file_path, "error": str(e)})
+            continue
+        
+        if meta_cache is not None:
+            meta_cache.put(json_path, stat, metadata)
+        yield file_path, metadata
+
+
+def _result_sort_key(result: Dict[str, Any]) -> Tuple[str, Path]:
+    """Sort key ordering update results by model name, then file."""
+    return (str(result["model_name"]).casefold(), result["file_path"])
 
 
-def _check_model_update(model_file: Path, client: CivitAIClient) -> Dict[str, Any]:
-    """Check if a model has updates available."""
-    json_path = model_file.with_suffix('.json')
+def _iter_models(root: Path, recursive: bool) -> Iterator[Tuple[Path, str]]:
+    """Walk a directory for model files that have a metadata sidecar.
     
-    if not json_path.exists():
-        raise Exception(f"No metadata file found for {model_file.name}")
+    Entries are filtered on their name before anything else, and scandir's
+    cached entry types mean most non-model entries never cost a stat().
     
-    # Load current metadata
-    with open(json_path, 'r', encoding='utf-8') as f:
-        current_metadata = json.load(f)
+    Args:
+        root: Directory to scan
+        recursive: Whether to descend into subdirectories
+        
+    Yields:
+        Tuples of (model file path, metadata JSON path)
+    """
+    stack = [os.fspath(root)]
     
-    model_id = current_metadata.get('modelId')
-    current_version_id = current_metadata.get('modelVersionId')
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.name.lower().endswith(MODEL_FILE_SUFFIXES) and entry.is_file():
+                        json_path = entry.path[:entry.path.rindex('.')] + '.json'
+                        if os.path.exists(json_path):
+                            yield Path(entry.path), json_path
+        except OSError:
+            # Unreadable directories are skipped, as glob() did
+            continue
+
+
+def _is_model_file(file_path: Union[Path, str]) -> bool:
+    """Check if file is a supported model file."""
+    return is_model_filename(file_path.name if isinstance(file_path, Path) else file_path)
+
+
+def _load_model_metadata(model_file: Path, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Load a model's metadata and make sure it has a model ID.
     
-    if not model_id:
+    Args:
+        model_file: Path to the model file
+        metadata: Already parsed metadata; read from disk when omitted
+        
+    Returns:
+        Metadata dictionary
+    """
+    if metadata is None:
+        json_path = model_file.with_suffix('.json')
+        
+        try:
+            metadata = jsonio.loads(json_path.read_bytes())
+        except FileNotFoundError:
+            raise Exception(f"No metadata file found for {model_file.name}")
+    
+    if not isinstance(metadata, dict) or not metadata.get('modelId'):
         raise Exception(f"No model ID found in metadata for {model_file.name}")
     
+    return metadata
+
+
+def _fetch_models(
+    client: CivitAIClient,
+    model_ids: List[str],
+    max_workers: int,
+    batch_size: int = 50,
+    on_batch: Optional[Callable[[int], None]] = None
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """Fetch several models with concurrent batched ``ids`` queries.
+    
+    Responses go through the client's on-disk cache, so rescans within the
+    cache TTL need no requests and later ones mostly revalidate. A failing
+    batch only affects the IDs it contained, and IDs that are not integers
+    are reported as errors without being requested.
+    
+    Args:
+        client: API client
+        model_ids: Unique model IDs to fetch
+        max_workers: Maximum number of concurrent batch requests
+        batch_size: Maximum number of IDs per request
+        on_batch: Optional callback receiving the size of each finished batch
+        
+    Returns:
+        Tuple of (model items by ID, error messages by ID)
+    """
+    model_items: Dict[str, Dict[str, Any]] = {}
+    fetch_errors: Dict[str, str] = {}
+    
+    # A malformed sidecar ID must not take down the batch it would join
+    invalid = [model_id for model_id in model_ids if not model_id.isdecimal()]
+    if invalid:
+        for model_id in invalid:
+            fetch_errors[model_id] = f"Invalid model ID: {model_id!r}"
+        model_ids = [model_id for model_id in model_ids if model_id.isdecimal()]
+        if on_batch:
+            on_batch(len(invalid))
+    
+    batches = [model_ids[i:i + batch_size] for i in range(0, len(model_ids), batch_size)]
+    
+    if not batches:
+        return model_items, fetch_errors
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        futures = {
+            executor.submit(client.get_models_by_ids_cached, batch, len(batch)): batch
+            for batch in batches
+        }
+        
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                for item in future.result().get('items', []):
+                    model_items[str(item.get('id'))] = item
+            except APIError as e:
+                for model_id in batch:
+                    fetch_errors[model_id] = str(e)
+            
+            if on_batch:
+                on_batch(len(batch))
+    
+    return model_items, fetch_errors
+
+
+def _check_model_update(
+    model_file: Path,
+    client: CivitAIClient,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Check if a model has updates available.
+    
+    Args:
+        model_file: Path to the model file
+        client: API client
+        metadata: Preloaded local metadata; read from disk when omitted
+        
+    Returns:
+        Update information dictionary
+    """
+    current_metadata = _load_model_metadata(model_file, metadata)
+    model_id = current_metadata['modelId']
+    
     # Get latest model information from API
-    model_data = client.get_model_by_id(model_id)
-    if isinstance(model_data, str):
-        raise Exception(f"Failed to get model info: {model_data}")
+    try:
+        model_data = client.get_model_by_id_cached(model_id)
+    except APIError as e:
+        raise Exception(f"Failed to get model info: {e}")
     
     if not model_data.get('items'):
         raise Exception("Model not found on CivitAI")
     
-    model_item = model_data['items'][0]
+    return _compare_versions(model_file, current_metadata, model_data['items'][0])
+
+
+def _compare_versions(
+    model_file: Path,
+    current_metadata: Dict[str, Any],
+    model_item: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Compare a model's local version against the versions on CivitAI.
+    
+    Args:
+        model_file: Path to the model file
+        current_metadata: Local metadata for the model
+        model_item: Model item from API
+        
+    Returns:
+        Update information dictionary
+    """
+    model_id = current_metadata['modelId']
+    current_version_id = current_metadata.get('modelVersionId')
     versions = model_item.get('modelVersions', [])
     
     if not versions:
         raise Exception("No versions available")
     
+    # Index every version once so each comparison is a dict lookup
+    idx_map = {v['id']: (i, v.get('publishedAt')) for i, v in enumerate(versions)}
+    current_entry = idx_map.get(current_version_id)
+    current_dt = _parse_published(current_entry[1]) if current_entry else None
+    
     # Find current version and check for newer ones
     current_version = None
     newer_versions = []
@@ -281,7 +587,7 @@ def _check_model_update(model_file: Path, client: CivitAIClient) -> Dict[str, An
     for version in versions:
         if version['id'] == current_version_id:
             current_version = version
-        elif current_version_id is None or _is_version_newer(version, current_version_id, versions):
+        elif current_version_id is None or _is_version_newer(version['id'], current_version_id, idx_map, current_dt):
             newer_versions.append(version)
     
     has_update = len(newer_versions) > 0
@@ -300,64 +606,97 @@ def _check_model_update(model_file: Path, client: CivitAIClient) -> Dict[str, An
     }
 
 
-def _is_version_newer(version: Dict[str, Any], current_version_id: int, all_versions: List[Dict[str, Any]]) -> bool:
-    """Check if a version is newer than the current version."""
+def _is_version_newer(
+    version_id: int,
+    current_version_id: Optional[int],
+    idx_map: Dict[int, Tuple[int, Optional[str]]],
+    current_dt: Optional[datetime] = None
+) -> bool:
+    """Check if a version is newer than the current version.
+    
+    Args:
+        version_id: ID of the version to check
+        current_version_id: ID of the locally installed version
+        idx_map: Mapping of version ID to (list index, publishedAt)
+        current_dt: Pre-parsed publish date of the current version
+        
+    Returns:
+        True if the version is newer
+    """
     if current_version_id is None:
         return True
     
-    # Find current version index
-    current_index = None
-    version_index = None
-    
-    for i, v in enumerate(all_versions):
-        if v['id'] == current_version_id:
-            current_index = i
-        if v['id'] == version['id']:
-            version_index = i
+    current_entry = idx_map.get(current_version_id)
+    version_entry = idx_map.get(version_id)
     
     # Versions are typically ordered newest first
-    if current_index is not None and version_index is not None:
-        return version_index < current_index
+    if current_entry is not None and version_entry is not None:
+        return version_entry[0] < current_entry[0]
     
     # Fallback to publish date comparison
-    current_date = None
-    version_date = None
-    
-    for v in all_versions:
-        if v['id'] == current_version_id:
-            current_date = v.get('publishedAt')
-        if v['id'] == version['id']:
-            version_date = v.get('publishedAt')
+    if current_dt is None and current_entry is not None:
+        current_dt = _parse_published(current_entry[1])
+    version_dt = _parse_published(version_entry[1]) if version_entry else None
     
-    if current_date and version_date:
+    if current_dt and version_dt:
         try:
-            current_dt = datetime.fromisoformat(current_date.replace('Z', '+00:00'))
-            version_dt = datetime.fromisoformat(version_date.replace('Z', '+00:00'))
             return version_dt > current_dt
-        except:
+        except TypeError:
+            # Naive and timezone-aware timestamps cannot be ordered
             pass
     
     return False
 
 
+def _parse_published(value: Optional[str]) -> Optional[datetime]:
+    """Parse an API publishedAt timestamp, returning None if it is invalid."""
+    if not value:
+        return None
+    
+    try:
+        return _parse_dt(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def _display_update_results(
     updates_available: List[Dict[str, Any]],
     up_to_date: List[Dict[str, Any]],
     errors: List[Dict[str, Any]],
     show_all: bool,
-    console: Console
+    console: "Console",
+    total_checked: Optional[int] = None
 ) -> None:
-    """Display update check results."""
-    console.print()
+    """Display update check results.
+    
+    Large result sets are rendered as several tables of
+    ``UPDATE_TABLE_PAGE_SIZE`` rows, since laying out one huge table is slow.
+    
+    Args:
+        updates_available: Models with updates available
+        up_to_date: Models that are up to date
+        errors: Models that could not be checked
+        show_all: Whether to list up-to-date models
+        console: Console to print to
+        total_checked: Number of models checked (sum of all lists if None)
+    """
+    from rich.table import Table
     
-    if updates_available:
-        console.print("[bold green]Models with updates available:[/bold green]")
-        
-        table = Table(show_header=True, header_style="bold magenta")
+    def new_table() -> Table:
+        table = Table(show_header=True, header_style="bold magenta", expand=False)
         table.add_column("Model", style="cyan", width=30)
         table.add_column("Current", style="yellow", width=15)
         table.add_column("Latest", style="green", width=15)
         table.add_column("Published", style="blue", width=12)
+        return table
+    
+    console.print()
+    
+    if updates_available:
+        console.print("[bold green]Models with updates available:[/bold green]")
+        
+        paginate = len(updates_available) > UPDATE_TABLE_PAGINATE_THRESHOLD
+        table = new_table()
         
         for update in updates_available:
             current_name = "Unknown"
@@ -368,11 +707,8 @@ def _display_update_results(
             
             published = update["latest_version"].get("publishedAt", "")
             if published:
-                try:
-                    dt = datetime.fromisoformat(published.replace('Z', '+00:00'))
-                    published = dt.strftime("%Y-%m-%d")
-                except:
-                    published = published.split('T')[0]
+                dt = _parse_published(published)
+                published = dt.strftime("%Y-%m-%d") if dt else published.split('T')[0]
             
             model_name = update["model_name"]
             if len(model_name) > 27:
@@ -384,8 +720,13 @@ def _display_update_results(
                 safe_str(latest_name), 
                 safe_str(published)
             )
+            
+            if paginate and table.row_count >= UPDATE_TABLE_PAGE_SIZE:
+                console.print(table)
+                table = new_table()
         
-        console.print(table)
+        if table.row_count:
+            console.print(table)
         console.print()
     
     if show_all and up_to_date:
@@ -407,7 +748,8 @@ def _display_update_results(
         console.print()
     
     # Summary
-    total_checked = len(updates_available) + len(up_to_date) + len(errors)
+    if total_checked is None:
+        total_checked = len(updates_available) + len(up_to_date) + len(errors)
     console.print(f"[bold]Summary:[/bold]")
     console.print(f"  Total models checked: {total_checked}")
     console.print(f"  Updates available: {len(updates_available)}")
@@ -418,18 +760,26 @@ def _display_update_results(
 def _download_updates(
     updates_available: List[Dict[str, Any]],
     client: CivitAIClient,
-    console: Console
+    console: "Console"
 ) -> None:
-    """Download available updates."""
+    """Download available updates, several at a time.
+    
+    The number of simultaneous downloads is taken from the
+    ``download_concurrency`` setting.
+    """
     console.print()
     console.print("[bold]Downloading updates...[/bold]")
     
     from ..download import download_model_by_id
     
-    success_count = 0
-    error_count = 0
-    
+    # Several local files of one model in the same folder resolve to the same
+    # target file, which must only be downloaded once
+    jobs = {}
     for update in updates_available:
+        key = (update["model_id"], update["latest_version"]["id"], update["file_path"].parent)
+        jobs.setdefault(key, update)
+    
+    def download_one(update: Dict[str, Any]) -> bool:
         model_name = update["model_name"]
         latest_version = update["latest_version"]
         model_file = update["file_path"]
@@ -444,15 +794,22 @@ def _download_updates(
             )
             
             if success:
-                success_count += 1
                 print_success(f"Downloaded: {downloaded_path}")
-            else:
-                error_count += 1
-                print_error(f"Failed to download {safe_str(model_name)}")
+                return True
+            
+            print_error(f"Failed to download {safe_str(model_name)}")
                 
         except Exception as e:
-            error_count += 1
             print_error(f"Error downloading {safe_str(model_name)}: {safe_str(str(e))}")
+        
+        return False
+    
+    max_workers = max(1, int(get_config().get("download_concurrency", 3)))
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        results = list(executor.map(download_one, jobs.values()))
+    
+    success_count = sum(results)
+    error_count = len(results) - success_count
     
     console.print()
     console.print(f"[bold]Download Summary:[/bold]")
@@ -1,9 +1,24 @@
 """Configuration management for AI Model CLI."""
 
-import json
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from .. import jsonio
+
+# Default folder names for model types whose folder differs from the type name
+_DEFAULT_FOLDER_NAMES = MappingProxyType({
+    "Checkpoint": "Stable-diffusion",
+    "LORA": "Lora",
+    "TextualInversion": "embeddings",
+    "Upscaler": "ESRGAN",
+    "Controlnet": "ControlNet"
+})
+
+# Configuration keys that affect resolved model paths
+_PATH_KEYS = frozenset(("default_download_path", "model_paths"))
 
 
 class Config:
@@ -38,6 +53,15 @@ class Config:
             "save_preview": True,
             "overwrite_existing": False,
             "metadata_recursive_default": False,
+            "metadata_workers": 8,
+            "update_concurrency": 16,
+            "download_concurrency": 3,
+            # Bytes read from the network per iteration while downloading
+            "http_chunk_size": 1024 * 1024,
+            # Concurrent range requests used for a single large download
+            "parallel_connections": 4,
+            # How long cached model responses are trusted before revalidating
+            "update_cache_ttl_seconds": 3600,
             # Model type specific paths
             "model_paths": {
                 "Checkpoint": "",
@@ -58,7 +82,12 @@ class Config:
             }
         }
         
+        # Nesting depth of batch() blocks and whether a save is pending
+        self._batching = 0
+        self._dirty = False
+        
         self._config = self._load_config()
+        self._rebuild_path_cache()
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
@@ -67,23 +96,22 @@ class Config:
             return self._defaults.copy()
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                config = jsonio.loads(f.read())
             
             # Merge with defaults to ensure all keys exist
             merged_config = self._defaults.copy()
             merged_config.update(config)
             return merged_config
             
-        except (json.JSONDecodeError, IOError) as e:
+        except (jsonio.JSONDecodeError, IOError) as e:
             print(f"Warning: Failed to load config file: {e}")
             return self._defaults.copy()
     
     def _save_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to file."""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            _write_if_changed(self.config_file, jsonio.dumps(config))
         except IOError as e:
             print(f"Error: Failed to save config file: {e}")
     
@@ -107,7 +135,47 @@ class Config:
             value: Value to set
         """
         self._config[key] = value
-        self._save_config(self._config)
+        if key in _PATH_KEYS:
+            self._rebuild_path_cache()
+        self._mark_dirty()
+    
+    def update(self, values: Mapping[str, Any]) -> None:
+        """Set several configuration values with a single save.
+        
+        Args:
+            values: Mapping of configuration keys to values
+        """
+        with self.batch():
+            self._config.update(values)
+            self._dirty = True
+        
+        if not _PATH_KEYS.isdisjoint(values):
+            self._rebuild_path_cache()
+    
+    @contextmanager
+    def batch(self) -> Iterator["Config"]:
+        """Defer saving until the outermost batch block exits.
+        
+        Example:
+            with config.batch():
+                config.set('timeout', 30)
+                config.set_model_path('LORA', '/models/lora')
+        """
+        self._batching += 1
+        try:
+            yield self
+        finally:
+            self._batching -= 1
+            if self._batching == 0 and self._dirty:
+                self._save_config(self._config)
+                self._dirty = False
+    
+    def _mark_dirty(self) -> None:
+        """Save the configuration now, or at the end of the current batch."""
+        self._dirty = True
+        if not self._batching:
+            self._save_config(self._config)
+            self._dirty = False
     
     def get_all(self) -> Dict[str, Any]:
         """Get all configuration values."""
@@ -116,7 +184,8 @@ class Config:
     def reset(self) -> None:
         """Reset configuration to defaults."""
         self._config = self._defaults.copy()
-        self._save_config(self._config)
+        self._rebuild_path_cache()
+        self._mark_dirty()
     
     def load_subfolders(self) -> Dict[str, str]:
         """Load custom subfolder configurations."""
@@ -124,16 +193,15 @@ class Config:
             return {}
         
         try:
-            with open(self.subfolders_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(self.subfolders_file, 'rb') as f:
+                return jsonio.loads(f.read())
+        except (jsonio.JSONDecodeError, IOError):
             return {}
     
     def save_subfolders(self, subfolders: Dict[str, str]) -> None:
         """Save custom subfolder configurations."""
         try:
-            with open(self.subfolders_file, 'w', encoding='utf-8') as f:
-                json.dump(subfolders, f, indent=2, ensure_ascii=False)
+            _write_if_changed(self.subfolders_file, jsonio.dumps(subfolders))
         except IOError as e:
             print(f"Error: Failed to save subfolders file: {e}")
     
@@ -146,6 +214,14 @@ class Config:
         Returns:
             Path object for the model type
         """
+        cached = self._model_path_cache.get(model_type)
+        if cached is not None:
+            return cached
+        
+        return self._resolve_model_path(model_type)
+    
+    def _resolve_model_path(self, model_type: str) -> Path:
+        """Resolve the download path for a model type from the configuration."""
         model_paths = self._config.get("model_paths", {})
         specific_path = model_paths.get(model_type, "")
         
@@ -157,6 +233,13 @@ class Config:
             folder_name = self._get_default_folder_name(model_type)
             return default_path / folder_name
     
+    def _rebuild_path_cache(self) -> None:
+        """Resolve and cache the download path of every known model type."""
+        self._model_path_cache: Dict[str, Path] = {
+            model_type: self._resolve_model_path(model_type)
+            for model_type in self._defaults["model_paths"]
+        }
+    
     def set_model_path(self, model_type: str, path: str) -> None:
         """Set download path for specific model type.
         
@@ -168,7 +251,8 @@ class Config:
             self._config["model_paths"] = {}
         
         self._config["model_paths"][model_type] = path
-        self._save_config(self._config)
+        self._rebuild_path_cache()
+        self._mark_dirty()
     
     def get_all_model_paths(self) -> Dict[str, str]:
         """Get all model type paths.
@@ -176,19 +260,7 @@ class Config:
         Returns:
             Dictionary of model type -> path mappings
         """
-        model_paths = self._config.get("model_paths", {})
-        result = {}
-        
-        for model_type in self._defaults["model_paths"]:
-            specific_path = model_paths.get(model_type, "")
-            if specific_path:
-                result[model_type] = specific_path
-            else:
-                default_path = Path(self._config.get("default_download_path"))
-                folder_name = self._get_default_folder_name(model_type)
-                result[model_type] = str(default_path / folder_name)
-        
-        return result
+        return {model_type: str(path) for model_type, path in self._model_path_cache.items()}
     
     def _get_default_folder_name(self, model_type: str) -> str:
         """Get default folder name for model type.
@@ -199,15 +271,22 @@ class Config:
         Returns:
             Default folder name for the model type
         """
-        folder_mapping = {
-            "Checkpoint": "Stable-diffusion",
-            "LORA": "Lora",
-            "TextualInversion": "embeddings",
-            "Upscaler": "ESRGAN",
-            "Controlnet": "ControlNet"
-        }
-        
-        return folder_mapping.get(model_type, model_type)
+        return _DEFAULT_FOLDER_NAMES.get(model_type, model_type)
+
+
+def _write_if_changed(path: Path, data: bytes) -> None:
+    """Atomically replace a file, skipping the write if it is unchanged.
+    
+    Raises:
+        OSError: If the file cannot be written
+    """
+    try:
+        if path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    
+    jsonio.write_atomic(path, data)
 
 
 # Global configuration instance
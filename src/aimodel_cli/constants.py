@@ -0,0 +1,38 @@
+"""Shared constants for AI Model CLI."""
+
+import re
+
+# Model types accepted by CivitAI, in display order
+MODEL_TYPES = (
+    "Checkpoint", "TextualInversion", "LORA", "LoCon", "DoRA",
+    "Hypernetwork", "AestheticGradient", "Controlnet", "Poses",
+    "VAE", "Upscaler", "MotionModule", "Wildcards", "Workflows", "Other"
+)
+MODEL_TYPES_SET = frozenset(MODEL_TYPES)
+
+BASE_MODELS = (
+    "SD 1.4", "SD 1.5", "SD 2.0", "SD 2.1", "SDXL 1.0", "SDXL Turbo",
+    "Stable Cascade", "Pony", "Flux.1 D", "Flux.1 S", "Other"
+)
+BASE_MODELS_SET = frozenset(BASE_MODELS)
+
+SORT_OPTIONS = (
+    "Newest", "Oldest", "Most Downloaded", "Highest Rated",
+    "Most Liked", "Most Buzz", "Most Discussed", "Most Collected", "Most Images"
+)
+SORT_OPTIONS_SET = frozenset(SORT_OPTIONS)
+
+PERIODS = ("All Time", "Year", "Month", "Week", "Day")
+PERIODS_SET = frozenset(PERIODS)
+
+# Extracts the model ID from a CivitAI model URL
+MODEL_ID_RE = re.compile(r'models/(\d+)')
+
+# Model file extensions, lowercase; a tuple so str.endswith() can test them
+# all in one call
+MODEL_FILE_SUFFIXES = ('.safetensors', '.pt', '.pth', '.ckpt', '.bin')
+
+
+def is_model_filename(name: str) -> bool:
+    """Check whether a file name has a supported model file extension."""
+    return name.lower().endswith(MODEL_FILE_SUFFIXES)
@@ -1,14 +1,50 @@
 """Download functionality for AI models."""
 
+import hashlib
+import os
+import threading
 import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Tuple
 
 import requests
 
-from ..api import CivitAIClient
+from ..api import APIError, CivitAIClient, get_client, get_download_session
 from ..config import get_config
-from ..models import ModelInfo, clean_filename
+from ..models import ModelInfo, clean_filename, get_hash_cache
+
+
+# Buffer size for the downloaded file
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Files at least this large are fetched with several range requests at once
+PARALLEL_MIN_SIZE = 64 * 1024 * 1024
+
+# Minimum number of bytes received between two progress clock checks
+PROGRESS_CHECK_BYTES = 256 * 1024
+
+# Sidecar keys recording the state of a download
+_DOWNLOAD_KEYS = ('expected_size', 'etag', 'last_modified')
+
+# Display units, indexed by power of 1024
+_SPEED_UNITS = ('B/s', 'KB/s', 'MB/s', 'GB/s', 'TB/s')
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+def _scale_1024(value: float, units: Tuple[str, ...]) -> str:
+    """Format a value with the largest fitting power-of-1024 unit.
+    
+    Args:
+        value: Non-negative value in base units
+        units: Unit names, starting with the base unit
+        
+    Returns:
+        Formatted value with one decimal place
+    """
+    # bit_length picks the unit directly instead of dividing in a loop
+    index = min(max(0, (int(value).bit_length() - 1) // 10), len(units) - 1)
+    return f"{value / (1 << (10 * index)):.1f} {units[index]}"
 
 
 class DownloadError(Exception):
@@ -16,13 +52,23 @@ class DownloadError(Exception):
     pass
 
 
+class _RangeNotSupported(Exception):
+    """Raised when the server ignores a range request."""
+    pass
+
+
 class Downloader:
     """Handle model downloads with HTTP."""
     
     def __init__(self):
         """Initialize downloader."""
         self.config = get_config()
-        self.client = CivitAIClient()
+        self.client = get_client()
+        
+        # Resolve settings once instead of on every request and chunk
+        self._timeout = self.config.get("timeout", 60)
+        self._chunk_size = max(1, int(self.config.get("http_chunk_size", 1024 * 1024)))
+        self._parallel_connections = int(self.config.get("parallel_connections", 4))
     
     
     def download_model(
@@ -78,36 +124,64 @@ class Downloader:
         """
         headers = {}
         downloaded = 0
+        model_info = ModelInfo(save_path)
+        expected_size = 0
+        
+        # Shared session, so repeated downloads reuse open connections
+        session = get_download_session()
         
         # Check for partial download
         if save_path.exists():
             downloaded = save_path.stat().st_size
-            headers['Range'] = f'bytes={downloaded}-'
-        
-        # Configure request session for better performance
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'AI-Model-CLI/1.0.0'
-        })
-        
-        # Add proxy configuration if set
-        proxy = self.config.get("proxy", "")
-        if proxy:
-            session.proxies = {'http': proxy, 'https': proxy}
-        
-        # Configure SSL verification
-        if self.config.get("disable_ssl", False):
-            session.verify = False
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            sidecar = model_info.load_from_json()
+            expected_size = int(sidecar.get('expected_size') or 0)
+            
+            # A complete file only needs a cheap check that it is still current
+            if downloaded == expected_size > 0 and self._is_unchanged(session, url, sidecar):
+                if progress_callback:
+                    progress_callback(1.0, "Already downloaded")
+                return True
+            
+            # A bounded range lets the server send an exact byte count
+            if 0 < downloaded < expected_size:
+                headers['Range'] = f'bytes={downloaded}-{expected_size - 1}'
+            else:
+                headers['Range'] = f'bytes={downloaded}-'
+            
+            # If the file changed since, the server sends all of it instead of
+            # a range that would be appended to stale bytes
+            etag = sidecar.get('etag')
+            if etag and not etag.startswith('W/'):
+                headers['If-Range'] = etag
+            elif sidecar.get('last_modified'):
+                headers['If-Range'] = sidecar['last_modified']
         
         try:
             response = session.get(
                 url,
                 headers=headers,
                 stream=True,
-                timeout=self.config.get("timeout", 60)
+                timeout=self._timeout
             )
+            
+            # A range starting at the end of a complete file (e.g. when HEAD is
+            # refused by a GET-only CDN link) is unsatisfiable; the total in the
+            # 416 tells whether the file is still whole
+            if response.status_code == 416 and 'Range' in headers:
+                response.close()
+                content_range = response.headers.get('content-range', '')
+                if (
+                    downloaded == expected_size > 0
+                    and content_range.startswith('bytes */')
+                    and content_range[8:] == str(expected_size)
+                ):
+                    if progress_callback:
+                        progress_callback(1.0, "Already downloaded")
+                    return True
+                
+                # Otherwise the local file is no use; fetch the file from scratch
+                response = session.get(url, stream=True, timeout=self._timeout)
+            
             response.raise_for_status()
             
             total_size = int(response.headers.get('content-length', 0))
@@ -115,64 +189,266 @@ class Downloader:
                 # Partial download - extract total size from range header
                 range_info = response.headers['content-range']
                 total_size = int(range_info.split('/')[-1])
-            elif response.status_code == 206:
-                # Partial content but no content-range header
-                pass
-            elif downloaded > 0:
-                # Server doesn't support resume, start fresh
-                downloaded = 0
-                save_path.unlink(missing_ok=True)
-                response.close()
-                return self._download_with_http(url, save_path, progress_callback)
             
+            # A server that ignores the range sends the whole file, so the
+            # same response restarts the download from scratch
             mode = 'ab' if downloaded > 0 and response.status_code == 206 else 'wb'
             if mode == 'wb':
                 downloaded = 0
                 save_path.unlink(missing_ok=True)
             
-            with open(save_path, mode) as f:
-                start_time = time.time()
-                last_update = 0
-                chunk_size = 32768  # 32KB chunks for better performance
+            # Remember the full size and validators, so an interrupted download
+            # resumes with a bounded range and a finished one is not fetched again
+            if total_size > 0:
+                download_info = {'expected_size': total_size}
+                if response.headers.get('etag'):
+                    download_info['etag'] = response.headers['etag']
+                if response.headers.get('last-modified'):
+                    download_info['last_modified'] = response.headers['last-modified']
+                model_info.save_to_json(download_info)
+            
+            # Large fresh downloads are split across several connections
+            connections = self._parallel_connections
+            if (
+                mode == 'wb'
+                and connections > 1
+                and total_size >= PARALLEL_MIN_SIZE
+                and response.headers.get('accept-ranges', '').lower() == 'bytes'
+            ):
+                response.close()
+                if self._download_parallel(session, url, save_path, total_size, connections, progress_callback):
+                    if progress_callback:
+                        progress_callback(1.0, "Download completed")
+                    return True
+                
+                # Ranges turned out to be unsupported; stream the file normally
+                response = session.get(url, stream=True, timeout=self._timeout)
+                response.raise_for_status()
+            
+            # A large write buffer batches chunks into few write() syscalls
+            # A fresh download is hashed as it streams, so the file never has
+            # to be read back just to learn its SHA256
+            hasher = hashlib.sha256() if mode == 'wb' else None
+            
+            with open(save_path, mode, buffering=WRITE_BUFFER_SIZE) as f:
+                if hasher is None:
+                    write = f.write
+                else:
+                    file_write, hash_update = f.write, hasher.update
+                    
+                    def write(chunk: bytes) -> None:
+                        file_write(chunk)
+                        hash_update(chunk)
+                
+                # Large chunks keep per-chunk Python and write() overhead negligible
+                chunks = response.iter_content(chunk_size=self._chunk_size)
                 
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if chunk:
-                        f.write(chunk)
+                if progress_callback is None:
+                    for chunk in chunks:
+                        write(chunk)
+                else:
+                    clock = time.time
+                    report = self._report_progress
+                    start_time = clock()
+                    last_update = 0
+                    # With small chunks, only look at the clock every few of them
+                    check_every = max(1, PROGRESS_CHECK_BYTES // self._chunk_size)
+                    unchecked = 0
+                    
+                    for chunk in chunks:
+                        write(chunk)
                         downloaded += len(chunk)
                         
-                        # Update progress
-                        now = time.time()
-                        if progress_callback and (now - last_update) > 0.5:
-                            elapsed = now - start_time
-                            speed = downloaded / elapsed if elapsed > 0 else 0
-                            
-                            if total_size > 0:
-                                progress = downloaded / total_size
-                                speed_str = self._format_speed(speed)
-                                remaining = total_size - downloaded
-                                eta_str = self._format_eta(remaining, speed)
-                                status_str = f"Downloading... {speed_str}, ETA: {eta_str}"
-                                progress_callback(progress, status_str)
-                            else:
-                                # Unknown total size
-                                speed_str = self._format_speed(speed)
-                                downloaded_str = self._format_size(downloaded)
-                                status_str = f"Downloading... {downloaded_str}, {speed_str}"
-                                progress_callback(0.0, status_str)
-                            
-                            last_update = now
+                        unchecked += 1
+                        if unchecked >= check_every:
+                            unchecked = 0
+                            now = clock()
+                            if now - last_update > 0.5:
+                                report(progress_callback, downloaded, total_size, now - start_time)
+                                last_update = now
+            
+            # A resumed file is only complete now, so hash all of it at once
+            if hasher is not None:
+                sha256 = hasher.hexdigest()
+            else:
+                sha256 = CivitAIClient.calculate_sha256(save_path).lower()
+            get_hash_cache().put(save_path, sha256)
             
             if progress_callback:
                 progress_callback(1.0, "Download completed")
             
             return True
             
+        except DownloadError:
+            raise
         except requests.exceptions.RequestException as e:
             raise DownloadError(f"HTTP download failed: {e}")
         except Exception as e:
             raise DownloadError(f"Download failed: {e}")
+    
+    def _is_unchanged(
+        self,
+        session: requests.Session,
+        url: str,
+        sidecar: Dict[str, Any]
+    ) -> bool:
+        """Check whether a completed download still matches the remote file.
+        
+        Args:
+            session: HTTP session to use
+            url: Download URL
+            sidecar: Model JSON data holding the recorded size and validators
+            
+        Returns:
+            True if a HEAD request reports the same size and ETag (or
+            Last-Modified date when there is no ETag)
+        """
+        try:
+            response = session.head(url, allow_redirects=True, timeout=self._timeout)
+            response.raise_for_status()
+            length = int(response.headers['content-length'])
+        except (requests.exceptions.RequestException, KeyError, ValueError):
+            return False
+        
+        if length != sidecar.get('expected_size'):
+            return False
+        
+        if sidecar.get('etag'):
+            return response.headers.get('etag') == sidecar['etag']
+        if sidecar.get('last_modified'):
+            return response.headers.get('last-modified') == sidecar['last_modified']
+        return True
+    
+    def _download_parallel(
+        self,
+        session: requests.Session,
+        url: str,
+        save_path: Path,
+        total_size: int,
+        connections: int,
+        progress_callback: Optional[Callable[[float, str], None]] = None
+    ) -> bool:
+        """Download a file with several concurrent range requests.
+        
+        Parts are written into a ``.part`` file at their own offsets, which
+        replaces the target only once every part has arrived. Nothing is left
+        behind on failure, since a holey file cannot be resumed by size. The
+        parts arrive out of order, so the assembled file is hashed before it
+        replaces the target.
+        
+        Args:
+            session: HTTP session to use
+            url: Download URL
+            save_path: Where to save the file
+            total_size: Size of the file in bytes
+            connections: Number of concurrent requests
+            progress_callback: Function to call with progress updates
+            
+        Returns:
+            True if the download succeeded, False if the server does not
+            honour range requests
+            
+        Raises:
+            DownloadError: If a part fails to download
+        """
+        part_path = save_path.with_name(save_path.name + '.part')
+        chunk_size = self._chunk_size
+        timeout = self._timeout
+        
+        part_size = -(-total_size // connections)
+        ranges = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+        
+        lock = threading.Lock()
+        cancelled = threading.Event()
+        downloaded = 0
+        
+        def fetch(start: int, end: int) -> None:
+            nonlocal downloaded
+            headers = {'Range': f'bytes={start}-{end}'}
+            with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                content_range = response.headers.get('content-range', '')
+                if response.status_code != 206 or not content_range.startswith(f'bytes {start}-'):
+                    raise _RangeNotSupported()
+                
+                # Each worker has its own handle, so seeks never interfere
+                with open(part_path, 'r+b', buffering=WRITE_BUFFER_SIZE) as f:
+                    f.seek(start)
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if cancelled.is_set():
+                            return
+                        if chunk:
+                            f.write(chunk)
+                            with lock:
+                                downloaded += len(chunk)
+        
+        with open(part_path, 'wb') as f:
+            f.truncate(total_size)
+        
+        try:
+            start_time = time.time()
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                pending = {executor.submit(fetch, start, end) for start, end in ranges}
+                
+                while pending:
+                    done, pending = wait(pending, timeout=0.5, return_when=FIRST_EXCEPTION)
+                    for future in done:
+                        if future.exception() is not None:
+                            cancelled.set()
+                            raise future.exception()
+                    
+                    if progress_callback and pending:
+                        with lock:
+                            current = downloaded
+                        self._report_progress(progress_callback, current, total_size, time.time() - start_time)
+            
+            if downloaded != total_size:
+                raise DownloadError(f"Incomplete download: got {downloaded} of {total_size} bytes")
+            
+            sha256 = CivitAIClient.calculate_sha256(part_path).lower()
+            os.replace(part_path, save_path)
+            get_hash_cache().put(save_path, sha256)
+            return True
+            
+        except _RangeNotSupported:
+            return False
         finally:
-            session.close()
+            cancelled.set()
+            part_path.unlink(missing_ok=True)
+    
+    def _report_progress(
+        self,
+        progress_callback: Callable[[float, str], None],
+        downloaded: int,
+        total_size: int,
+        elapsed: float
+    ) -> None:
+        """Report download progress with speed and ETA.
+        
+        Args:
+            progress_callback: Function to call with progress updates
+            downloaded: Bytes downloaded so far
+            total_size: Total size in bytes (0 if unknown)
+            elapsed: Seconds since the download started
+        """
+        speed = downloaded / elapsed if elapsed > 0 else 0
+        
+        if total_size > 0:
+            progress = downloaded / total_size
+            speed_str = self._format_speed(speed)
+            remaining = total_size - downloaded
+            eta_str = self._format_eta(remaining, speed)
+            status_str = f"Downloading... {speed_str}, ETA: {eta_str}"
+            progress_callback(progress, status_str)
+        else:
+            # Unknown total size
+            speed_str = self._format_speed(speed)
+            downloaded_str = self._format_size(downloaded)
+            status_str = f"Downloading... {downloaded_str}, {speed_str}"
+            progress_callback(0.0, status_str)
     
     def _format_speed(self, bytes_per_sec: float) -> str:
         """Format download speed for display.
@@ -183,11 +459,7 @@ class Downloader:
         Returns:
             Formatted speed string
         """
-        for unit in ['B/s', 'KB/s', 'MB/s', 'GB/s']:
-            if bytes_per_sec < 1024:
-                return f"{bytes_per_sec:.1f} {unit}"
-            bytes_per_sec /= 1024
-        return f"{bytes_per_sec:.1f} TB/s"
+        return _scale_1024(bytes_per_sec, _SPEED_UNITS)
     
     def _format_size(self, bytes_count: int) -> str:
         """Format file size for display.
@@ -198,11 +470,7 @@ class Downloader:
         Returns:
             Formatted size string
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_count < 1024:
-                return f"{bytes_count:.1f} {unit}"
-            bytes_count /= 1024
-        return f"{bytes_count:.1f} PB"
+        return _scale_1024(bytes_count, _SIZE_UNITS)
     
     def _format_eta(self, remaining_bytes: int, speed: float) -> str:
         """Format ETA for display.
@@ -230,6 +498,29 @@ class Downloader:
     
 
 
+def _discard_download(save_path: Path) -> None:
+    """Delete a downloaded file together with its download bookkeeping.
+    
+    Args:
+        save_path: Path of the downloaded file
+    """
+    get_hash_cache().discard(save_path)
+    save_path.unlink(missing_ok=True)
+    
+    model_info = ModelInfo(save_path)
+    data = model_info.load_from_json()
+    if not any(key in data for key in _DOWNLOAD_KEYS):
+        return
+    
+    for key in _DOWNLOAD_KEYS:
+        data.pop(key, None)
+    
+    if data:
+        model_info.save_to_json(data, overwrite=True)
+    else:
+        model_info.json_path.unlink(missing_ok=True)
+
+
 def download_model_by_id(
     model_id: int,
     version_id: Optional[int] = None,
@@ -249,13 +540,14 @@ def download_model_by_id(
     Returns:
         Tuple of (success, saved_file_path)
     """
-    client = CivitAIClient()
+    client = get_client()
     config = get_config()
     
     # Get model information
-    model_data = client.get_model_by_id(model_id)
-    if isinstance(model_data, str):
-        raise DownloadError(f"Failed to get model info: {model_data}")
+    try:
+        model_data = client.get_model_by_id(model_id)
+    except APIError as e:
+        raise DownloadError(f"Failed to get model info: {e}")
     
     if not model_data.get('items'):
         raise DownloadError("Model not found")
@@ -306,17 +598,29 @@ def download_model_by_id(
     )
     
     if success:
-        # Save metadata
-        model_info = ModelInfo(save_path)
+        # Verify against the hash recorded when the download finished; a file
+        # that was already complete may predate the cache
         sha256 = file_info.get('hashes', {}).get('SHA256')
-        if sha256:
-            model_info.save_to_json({'sha256': sha256})
+        downloaded_sha256 = get_hash_cache().get(save_path)
+        if sha256 and not downloaded_sha256:
+            downloaded_sha256 = CivitAIClient.calculate_sha256(save_path).lower()
+        if sha256 and downloaded_sha256 and downloaded_sha256 != sha256.lower():
+            # Drop the corrupt file and everything that would let a rerun
+            # treat it as complete
+            _discard_download(save_path)
+            raise DownloadError(
+                f"SHA256 mismatch for {save_path.name}: expected {sha256.upper()}, "
+                f"got {downloaded_sha256.upper()}"
+            )
+        sha256 = sha256 or downloaded_sha256
         
-        model_info.save_model_metadata(model_data, sha256)
+        # Save hash and metadata of the selected version in a single write
+        model_info = ModelInfo(save_path)
+        model_info.save_version_metadata(model_item, version, sha256=sha256)
         
         # Save preview if configured
         if config.get("save_preview", True):
-            model_info.save_preview_image(model_data, sha256)
+            model_info.save_version_preview(version)
         
         return True, save_path
     else:
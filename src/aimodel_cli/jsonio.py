@@ -0,0 +1,69 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+# orjson raises its own error type, which subclasses this one
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def loads(data: Any) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+    
+    def dumps(obj: Any) -> bytes:
+        """Serialize to indented, UTF-8 encoded JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def loads(data: Any) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
+    
+    def dumps(obj: Any) -> bytes:
+        """Serialize to indented, UTF-8 encoded JSON."""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def dump_atomic(obj: Any, path: Path) -> None:
+    """Write JSON so readers never observe a partially written file.
+    
+    Args:
+        obj: Object to serialize
+        path: Destination file
+        
+    Raises:
+        OSError: If the file cannot be written
+    """
+    write_atomic(path, dumps(obj))
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes through a temporary file and an atomic rename.
+    
+    Args:
+        path: Destination file
+        data: File contents
+        
+    Raises:
+        OSError: If the file cannot be written
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
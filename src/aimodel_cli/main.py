@@ -9,7 +9,7 @@ from .commands.config import config
 from .commands.info import info
 from .commands.metadata import metadata
 from .commands.update import update
-from .utils import print_error, print_info
+from .utils import print_error, print_info, mask_secret
 
 
 @click.group()
@@ -67,52 +67,54 @@ def setup() -> None:
     console.print("[bold]AI Model CLI Setup Wizard[/bold]")
     console.print()
     
-    # API Key setup
-    console.print("1. API Key Configuration")
-    console.print("   Get your CivitAI API key from: https://civitai.com/user/account")
-    
-    current_key = config_obj.get('api_key', '')
-    if current_key:
-        masked_key = f"{'*' * (len(current_key) - 4)}{current_key[-4:]}"
-        console.print(f"   Current API key: {masked_key}")
-        if not click.confirm("Do you want to update your API key?"):
-            api_key = current_key
-        else:
-            api_key = click.prompt('   Enter your API key', hide_input=True)
-    else:
-        console.print("   No API key configured.")
-        if click.confirm("Do you want to set up your API key now?"):
-            api_key = click.prompt('   Enter your API key', hide_input=True)
+    # Save all answers at once at the end of the wizard
+    with config_obj.batch():
+        # API Key setup
+        console.print("1. API Key Configuration")
+        console.print("   Get your CivitAI API key from: https://civitai.com/user/account")
+        
+        current_key = config_obj.get('api_key', '')
+        if current_key:
+            masked_key = mask_secret(current_key)
+            console.print(f"   Current API key: {masked_key}")
+            if not click.confirm("Do you want to update your API key?"):
+                api_key = current_key
+            else:
+                api_key = click.prompt('   Enter your API key', hide_input=True)
         else:
-            api_key = ''
-    
-    if api_key:
-        config_obj.set('api_key', api_key)
-        console.print("   ✓ API key configured")
-    
-    console.print()
-    
-    # Download path setup
-    console.print("2. Download Path Configuration")
-    current_path = config_obj.get('default_download_path')
-    console.print(f"   Current download path: {current_path}")
-    
-    if click.confirm("Do you want to change the download path?"):
-        new_path = click.prompt('   Enter new download path', default=current_path)
-        config_obj.set('default_download_path', new_path)
-        console.print("   ✓ Download path updated")
-    
-    console.print()
-    
-    # Download settings
-    console.print("3. Download Settings")
-    
-    show_nsfw = config_obj.get('show_nsfw', False)
-    console.print(f"   Show NSFW content: {show_nsfw}")
-    if click.confirm("Do you want to change this setting?"):
-        show_nsfw = click.confirm("Show NSFW content in search results?")
-        config_obj.set('show_nsfw', show_nsfw)
-        console.print("   ✓ NSFW setting updated")
+            console.print("   No API key configured.")
+            if click.confirm("Do you want to set up your API key now?"):
+                api_key = click.prompt('   Enter your API key', hide_input=True)
+            else:
+                api_key = ''
+        
+        if api_key:
+            config_obj.set('api_key', api_key)
+            console.print("   ✓ API key configured")
+        
+        console.print()
+        
+        # Download path setup
+        console.print("2. Download Path Configuration")
+        current_path = config_obj.get('default_download_path')
+        console.print(f"   Current download path: {current_path}")
+        
+        if click.confirm("Do you want to change the download path?"):
+            new_path = click.prompt('   Enter new download path', default=current_path)
+            config_obj.set('default_download_path', new_path)
+            console.print("   ✓ Download path updated")
+        
+        console.print()
+        
+        # Download settings
+        console.print("3. Download Settings")
+        
+        show_nsfw = config_obj.get('show_nsfw', False)
+        console.print(f"   Show NSFW content: {show_nsfw}")
+        if click.confirm("Do you want to change this setting?"):
+            show_nsfw = click.confirm("Show NSFW content in search results?")
+            config_obj.set('show_nsfw', show_nsfw)
+            console.print("   ✓ NSFW setting updated")
     
     console.print()
     console.print("[bold green]Setup completed![/bold green]")
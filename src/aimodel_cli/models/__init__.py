@@ -1,5 +1,22 @@
 """Model management module."""
 
-from .model_info import ModelInfo, get_model_type_from_path, clean_filename
+from .model_info import (
+    ModelInfo,
+    get_model_type_from_path,
+    clean_filename,
+    build_sha_index,
+    bulk_hash,
+    save_version_previews,
+)
+from .hash_cache import HashCache, get_hash_cache
 
-__all__ = ["ModelInfo", "get_model_type_from_path", "clean_filename"]
\ No newline at end of file
+__all__ = [
+    "ModelInfo",
+    "get_model_type_from_path",
+    "clean_filename",
+    "build_sha_index",
+    "bulk_hash",
+    "save_version_previews",
+    "HashCache",
+    "get_hash_cache",
+]
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""Persistent SHA256 cache for model files."""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ..config import get_config
+
+
+class HashCache:
+    """SQLite-backed cache of model file SHA256 hashes.
+    
+    Entries are keyed by absolute path and are only returned while the file's
+    size and modification time are unchanged, so untouched files never need
+    to be re-hashed across CLI invocations.
+    """
+    
+    def __init__(self, db_path: Path):
+        """Initialize hash cache.
+        
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Get the database connection, opening it if needed."""
+        # SQLite connections must not be shared across a fork, so worker
+        # processes each open their own
+        if self._conn is None or self._pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                "path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, sha256 TEXT NOT NULL)"
+            )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+    
+    def get(self, file_path: Path) -> Optional[str]:
+        """Get the cached hash for a file if it is unchanged.
+        
+        Args:
+            file_path: Path to the model file
+            
+        Returns:
+            Cached SHA256 hash, or None on a miss
+        """
+        try:
+            stat = os.stat(file_path)
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT sha256 FROM hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                    (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns),
+                ).fetchone()
+        except (OSError, sqlite3.Error):
+            return None
+        
+        return row[0] if row else None
+    
+    def put(self, file_path: Path, sha256: str) -> None:
+        """Store the hash for a file.
+        
+        Args:
+            file_path: Path to the model file
+            sha256: SHA256 hash of the file
+        """
+        try:
+            stat = os.stat(file_path)
+            with self._lock:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO hashes (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+                    (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns, sha256),
+                )
+        except (OSError, sqlite3.Error):
+            # The cache is an optimization only; never fail hashing because of it
+            pass
+    
+    def discard(self, file_path: Path) -> None:
+        """Remove the cached hash for a file, if any.
+        
+        Args:
+            file_path: Path to the model file
+        """
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "DELETE FROM hashes WHERE path = ?",
+                    (os.path.abspath(file_path),),
+                )
+        except sqlite3.Error:
+            pass
+    
+    def prune(self, directory: Path) -> int:
+        """Remove cached hashes for files under a directory that no longer exist.
+        
+        Args:
+            directory: Directory whose entries are checked
+            
+        Returns:
+            Number of entries removed
+        """
+        prefix = os.path.join(os.path.abspath(directory), "")
+        try:
+            with self._lock:
+                conn = self._connect()
+                missing = [
+                    (path,) for (path,) in conn.execute("SELECT path FROM hashes")
+                    if path.startswith(prefix) and not os.path.exists(path)
+                ]
+                if missing:
+                    conn.executemany("DELETE FROM hashes WHERE path = ?", missing)
+        except sqlite3.Error:
+            return 0
+        
+        return len(missing)
+
+
+# Global hash cache instance
+_hash_cache = None
+
+
+def get_hash_cache() -> HashCache:
+    """Get global hash cache instance."""
+    global _hash_cache
+    if _hash_cache is None:
+        _hash_cache = HashCache(get_config().config_dir / "cache" / "hashes.sqlite")
+    return _hash_cache
@@ -1,17 +1,43 @@
 """Model information and metadata handling."""
 
-import hashlib
-import json
+import html
+import multiprocessing
 import os
+import platform
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import cached_property
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from PIL import Image
-import requests
 from bs4 import BeautifulSoup
 
-from ..config import get_config
+from .. import jsonio
+from ..api import CivitAIClient, get_download_session
+from ..config import Config, get_config
+from .hash_cache import get_hash_cache
+
+# Preview downloads are small and latency-bound, so many run at once
+PREVIEW_WORKERS = 16
+
+# Description cleaning fast path; BeautifulSoup is only used for markup these
+# simple patterns cannot handle faithfully
+_TAG_RE = re.compile(r'<[^>]+>')
+# href must be its own attribute, not the tail of one like data-href
+_A_RE = re.compile(r'<a\s(?:[^>]*?\s)?href="([^"]+)"[^>]*>(.*?)</a>', re.I | re.S)
+_A_OPEN_RE = re.compile(r'<a\b', re.I)
+# A "<" that does not start a tag name is literal text, which _TAG_RE would strip
+_COMPLEX_MARKUP_RE = re.compile(r'<(?:script|style|!|(?!/?[a-z]))', re.I)
+
+_TRAINED_INLINE_RE = re.compile(r'<[^>]*:[^>]*>')
+_COMMA_RE = re.compile(r', ?')
+_WIDTH_RE = re.compile(r'/width=\d+')
+_WS_RE = re.compile(r'\s+')
+
+_IS_WINDOWS = platform.system() == "Windows"
+_ILLEGAL_RE = re.compile(r'[\\/:*?"<>|]' if _IS_WINDOWS else r'[/]')
 
 
 class ModelInfo:
@@ -24,60 +50,120 @@ class ModelInfo:
             file_path: Path to model file
         """
         self.file_path = Path(file_path)
-        self.config = get_config()
         self.json_path = self.file_path.with_suffix('.json')
         self.preview_path = self.file_path.with_suffix('.preview.png')
     
-    def generate_sha256(self) -> str:
+    @cached_property
+    def config(self) -> Config:
+        """Global configuration, looked up on first use."""
+        return get_config()
+    
+    def generate_sha256(self, save_to_json: bool = True) -> str:
         """Generate SHA256 hash for the model file.
         
+        Args:
+            save_to_json: Whether to record a newly computed hash in the JSON file
+            
         Returns:
             SHA256 hash string
         """
-        # Check if hash already exists in JSON
-        if self.json_path.exists():
-            try:
-                with open(self.json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'sha256' in data and data['sha256']:
-                        return data['sha256']
-            except (json.JSONDecodeError, IOError):
-                pass
+        # Check if a still-valid hash already exists in JSON
+        data = self.load_from_json()
+        cached = self.get_cached_sha256(data)
+        if cached:
+            return cached
+        
+        # Fall back to the persistent cache before reading the whole file
+        hash_cache = get_hash_cache()
+        hash_value = hash_cache.get(self.file_path)
+        if not hash_value:
+            # Generate hash (file_digest on 3.11+, 1 MiB readinto loop otherwise)
+            hash_value = CivitAIClient.calculate_sha256(self.file_path).lower()
+            hash_cache.put(self.file_path, hash_value)
+        
+        # Save to JSON, unless the sidecar already records this exact hash
+        if save_to_json:
+            fingerprint = self._stat_fingerprint()
+            if data.get('sha256') != hash_value or data.get('sha256_stat') != fingerprint:
+                self.save_to_json({'sha256': hash_value, 'sha256_stat': fingerprint})
+        
+        return hash_value
+    
+    def _stat_fingerprint(self) -> List[int]:
+        """Get the [size, mtime_ns] fingerprint of the model file."""
+        stat = self.file_path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+    
+    def get_cached_sha256(self, data: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Get the SHA256 hash cached in the JSON file, if still valid.
         
-        # Generate hash
-        h = hashlib.sha256()
-        with open(self.file_path, 'rb') as f:
-            while chunk := f.read(8192):
-                h.update(chunk)
+        The cached hash is only trusted while the model file's size and
+        modification time match the fingerprint stored alongside it.
         
-        hash_value = h.hexdigest()
+        Args:
+            data: Already loaded JSON data, to avoid reading the file again
+            
+        Returns:
+            Cached hash, or None if missing or stale
+        """
+        if data is None:
+            data = self.load_from_json()
         
-        # Save to JSON
-        self.save_to_json({'sha256': hash_value})
+        sha256 = data.get('sha256')
+        if not sha256:
+            return None
         
-        return hash_value
+        # Hashes saved before fingerprints were recorded are trusted as-is
+        fingerprint = data.get('sha256_stat')
+        if fingerprint is not None:
+            try:
+                if fingerprint != self._stat_fingerprint():
+                    return None
+            except OSError:
+                return None
+        
+        return sha256
+    
+    def cache_sha256(self, sha256: str) -> None:
+        """Save a SHA256 hash together with the model file's fingerprint.
+        
+        Args:
+            sha256: SHA256 hash of the model file
+        """
+        self.save_to_json({'sha256': sha256, 'sha256_stat': self._stat_fingerprint()})
     
-    def save_to_json(self, data: Dict[str, Any], overwrite: bool = False) -> None:
+    def save_to_json(
+        self,
+        data: Dict[str, Any],
+        overwrite: bool = False,
+        existing_data: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Save data to model JSON file.
         
         Args:
             data: Data to save
             overwrite: Whether to overwrite existing data
+            existing_data: Already loaded JSON data, to avoid reading the file again
         """
-        existing_data = {}
-        if self.json_path.exists() and not overwrite:
-            try:
-                with open(self.json_path, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+        if overwrite:
+            existing_data = {}
+        elif existing_data is None:
+            existing_data = self.load_from_json()
+        else:
+            existing_data = dict(existing_data)
+        
+        # Nothing to do when every value is already stored
+        if existing_data and all(
+            k in existing_data and existing_data[k] == v for k, v in data.items()
+        ):
+            return
         
         # Merge data
         existing_data.update(data)
         
+        # Serialize to bytes once and write them with a single call
         try:
-            with open(self.json_path, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, indent=2, ensure_ascii=False)
+            self.json_path.write_bytes(jsonio.dumps(existing_data))
         except IOError as e:
             print(f"Error saving JSON file: {e}")
     
@@ -87,13 +173,9 @@ class ModelInfo:
         Returns:
             Model data dictionary
         """
-        if not self.json_path.exists():
-            return {}
-        
         try:
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            return jsonio.loads(self.json_path.read_bytes())
+        except (jsonio.JSONDecodeError, IOError):
             return {}
     
     def get_model_id(self) -> Optional[str]:
@@ -109,7 +191,8 @@ class ModelInfo:
         self,
         api_data: Dict[str, Any],
         sha256: Optional[str] = None,
-        overwrite: bool = False
+        overwrite: bool = False,
+        sha_index: Optional[Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]] = None
     ) -> bool:
         """Save model metadata from API response.
         
@@ -117,6 +200,7 @@ class ModelInfo:
             api_data: API response data
             sha256: SHA256 hash to match
             overwrite: Whether to overwrite existing data
+            sha_index: Index of api_data from build_sha_index, to reuse across files
             
         Returns:
             True if successful, False otherwise
@@ -124,21 +208,43 @@ class ModelInfo:
         if not sha256:
             sha256 = self.generate_sha256()
         
+        if sha_index is None:
+            sha_index = build_sha_index(api_data)
+        
         # Find matching model in API data
-        for item in api_data.get('items', []):
-            for version in item.get('modelVersions', []):
-                for file_info in version.get('files', []):
-                    file_sha256 = file_info.get('hashes', {}).get('SHA256', '')
-                    if file_sha256.upper() == sha256.upper():
-                        return self._save_metadata_for_version(item, version, overwrite)
+        match = sha_index.get(sha256.upper())
+        if match:
+            item, version = match
+            return self._save_metadata_for_version(item, version, overwrite)
         
         return False
     
+    def save_version_metadata(
+        self,
+        model_meta: Dict[str, Any],
+        version_data: Dict[str, Any],
+        overwrite: bool = False,
+        sha256: Optional[str] = None
+    ) -> bool:
+        """Save metadata for an already identified model version.
+        
+        Args:
+            model_meta: Model summary (as nested in a by-hash version response)
+            version_data: Version data from API
+            overwrite: Whether to overwrite existing data
+            sha256: Known SHA256 hash of the model file, stored in the same write
+            
+        Returns:
+            True if successful
+        """
+        return self._save_metadata_for_version(model_meta, version_data, overwrite, sha256)
+    
     def _save_metadata_for_version(
         self,
         model_item: Dict[str, Any],
         version_info: Dict[str, Any],
-        overwrite: bool
+        overwrite: bool,
+        sha256: Optional[str] = None
     ) -> bool:
         """Save metadata for a specific model version.
         
@@ -146,6 +252,7 @@ class ModelInfo:
             model_item: Model item from API
             version_info: Version info from API
             overwrite: Whether to overwrite existing data
+            sha256: Known SHA256 hash of the model file, stored in the same write
             
         Returns:
             True if successful
@@ -158,8 +265,8 @@ class ModelInfo:
         # Clean up trained words
         if isinstance(trained_words, list):
             trained_tags = ','.join(trained_words)
-            trained_tags = re.sub(r'<[^>]*:[^>]*>', '', trained_tags)
-            trained_tags = re.sub(r', ?', ', ', trained_tags)
+            trained_tags = _TRAINED_INLINE_RE.sub('', trained_tags)
+            trained_tags = _COMMA_RE.sub(', ', trained_tags)
             trained_tags = trained_tags.strip(', ')
         else:
             trained_tags = str(trained_words) if trained_words else ''
@@ -192,11 +299,15 @@ class ModelInfo:
             metadata["description"] = description
         
         # Add model IDs
-        metadata["modelId"] = model_item.get('id')
+        metadata["modelId"] = model_item.get('id', version_info.get('modelId'))
         metadata["modelVersionId"] = version_info.get('id')
         
+        if sha256:
+            metadata["sha256"] = sha256
+            metadata["sha256_stat"] = self._stat_fingerprint()
+        
         if metadata:
-            self.save_to_json(metadata, overwrite)
+            self.save_to_json(metadata, overwrite, existing_data)
             return True
         
         return False
@@ -210,6 +321,19 @@ class ModelInfo:
         Returns:
             Cleaned text
         """
+        if not _COMPLEX_MARKUP_RE.search(description):
+            def replace_link(match: re.Match) -> str:
+                href = html.unescape(match.group(1))
+                if self._is_image_url(href):
+                    return match.group(2)
+                return f"{match.group(2)} {match.group(1)}"
+            
+            text, link_count = _A_RE.subn(replace_link, description)
+            
+            # Every anchor must have been understood, otherwise let BS4 handle it
+            if link_count == len(_A_OPEN_RE.findall(description)):
+                return html.unescape(_TAG_RE.sub('', text))
+        
         try:
             soup = BeautifulSoup(description, 'html.parser')
             
@@ -241,7 +365,8 @@ class ModelInfo:
         self,
         api_data: Dict[str, Any],
         sha256: Optional[str] = None,
-        overwrite: bool = False
+        overwrite: bool = False,
+        sha_index: Optional[Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]] = None
     ) -> Optional[Path]:
         """Save preview image for the model.
         
@@ -249,28 +374,49 @@ class ModelInfo:
             api_data: API response data
             sha256: SHA256 hash to match
             overwrite: Whether to overwrite existing image
+            sha_index: Index of api_data from build_sha_index, to reuse across files
             
         Returns:
             Path to saved image or None
         """
+        # An existing preview makes hashing and matching unnecessary
+        if self.preview_path.exists() and not overwrite:
+            return self.preview_path
+        
         if not sha256:
             sha256 = self.generate_sha256()
         
-        preview_path = self.file_path.with_suffix('.preview.png')
-        
-        if preview_path.exists() and not overwrite:
-            return preview_path
+        if sha_index is None:
+            sha_index = build_sha_index(api_data)
         
         # Find matching model and get first image
-        for item in api_data.get('items', []):
-            for version in item.get('modelVersions', []):
-                for file_info in version.get('files', []):
-                    file_sha256 = file_info.get('hashes', {}).get('SHA256', '')
-                    if file_sha256.upper() == sha256.upper():
-                        # Get first image from this version
-                        for image in version.get('images', []):
-                            if image.get('type') == 'image':
-                                return self._download_image(image['url'], preview_path)
+        match = sha_index.get(sha256.upper())
+        if match:
+            return self.save_version_preview(match[1], overwrite)
+        
+        return None
+    
+    def save_version_preview(
+        self,
+        version_data: Dict[str, Any],
+        overwrite: bool = False
+    ) -> Optional[Path]:
+        """Save preview image for an already identified model version.
+        
+        Args:
+            version_data: Version data from API
+            overwrite: Whether to overwrite existing image
+            
+        Returns:
+            Path to saved image or None
+        """
+        if self.preview_path.exists() and not overwrite:
+            return self.preview_path
+        
+        # Get first image from this version
+        for image in version_data.get('images', []):
+            if image.get('type') == 'image':
+                return self._download_image(image['url'], self.preview_path)
         
         return None
     
@@ -284,23 +430,137 @@ class ModelInfo:
         Returns:
             Path to saved image or None if failed
         """
+        # Stream to a temporary file so a failed transfer never leaves a
+        # truncated preview that later runs would treat as complete
+        temp_path = save_path.with_name(save_path.name + '.part')
         try:
             # Get full resolution image
-            url_with_width = re.sub(r'/width=\d+', '/width=512', url)
-            
-            response = requests.get(url_with_width, timeout=30)
-            response.raise_for_status()
+            url_with_width = _WIDTH_RE.sub('/width=512', url)
             
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
+            with get_download_session().get(url_with_width, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                with open(temp_path, 'wb', buffering=1 << 20) as f:
+                    for chunk in response.iter_content(chunk_size=1 << 17):
+                        f.write(chunk)
             
+            os.replace(temp_path, save_path)
             return save_path
             
         except Exception as e:
+            temp_path.unlink(missing_ok=True)
             print(f"Failed to download preview image: {e}")
             return None
 
 
+def build_sha_index(
+    api_data: Dict[str, Any]
+) -> Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Index the files of a models API response by SHA256 hash.
+    
+    Args:
+        api_data: API response data
+        
+    Returns:
+        Mapping of uppercase SHA256 hash to (model item, version); the first
+        file listed wins when a hash appears more than once
+    """
+    index = {}
+    for item in api_data.get('items', []):
+        for version in item.get('modelVersions', []):
+            for file_info in version.get('files', []):
+                file_sha256 = file_info.get('hashes', {}).get('SHA256')
+                if file_sha256:
+                    index.setdefault(file_sha256.upper(), (item, version))
+    
+    return index
+
+
+def _hash_worker(file_path: Path, save_to_json: bool = True) -> Tuple[Path, Optional[str]]:
+    """Hash a model file, possibly in a worker process.
+    
+    Args:
+        file_path: Path to the model file
+        save_to_json: Whether to record the hash in the model's JSON file
+        
+    Returns:
+        Tuple of (file_path, sha256), with sha256 None if hashing failed
+    """
+    try:
+        return file_path, ModelInfo(file_path).generate_sha256(save_to_json)
+    except Exception:
+        return file_path, None
+
+
+def bulk_hash(
+    paths: Sequence[Path],
+    max_workers: Optional[int] = None,
+    save_to_json: bool = True
+) -> Iterator[Tuple[Path, Optional[str]]]:
+    """Hash many model files across several processes.
+    
+    Files already in the persistent hash cache are handled in this process
+    first, so a fully cached batch never starts a worker pool. Workers are
+    spawned rather than forked, because callers typically run this while
+    a progress display thread holds locks that a forked child would inherit.
+    
+    Args:
+        paths: Model files to hash
+        max_workers: Maximum number of worker processes (CPU count if None)
+        save_to_json: Whether to record hashes in each file's JSON like
+            generate_sha256 does
+        
+    Yields:
+        Tuples of (path, sha256 or None if hashing failed)
+    """
+    hash_cache = get_hash_cache()
+    pending = []
+    for path in paths:
+        if hash_cache.get(path):
+            yield _hash_worker(path, save_to_json)
+        else:
+            pending.append(path)
+    
+    if not pending:
+        return
+    
+    workers = min(len(pending), max_workers or os.cpu_count() or 1)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        yield from pool.map(_hash_worker, pending, repeat(save_to_json), chunksize=1)
+
+
+def save_version_previews(
+    jobs: Sequence[Tuple[ModelInfo, Dict[str, Any]]],
+    max_workers: int = PREVIEW_WORKERS,
+    overwrite: bool = False
+) -> Iterator[Tuple[ModelInfo, Optional[Path], Optional[Exception]]]:
+    """Save preview images for many model versions concurrently.
+    
+    Args:
+        jobs: Pairs of (model info, version data from API)
+        max_workers: Maximum number of simultaneous downloads
+        overwrite: Whether to overwrite existing images
+        
+    Yields:
+        Tuples of (model info, saved image path or None, error or None) in
+        completion order
+    """
+    if not jobs:
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(len(jobs), max_workers)) as executor:
+        futures = {
+            executor.submit(model_info.save_version_preview, version_data, overwrite): model_info
+            for model_info, version_data in jobs
+        }
+        
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as e:
+                yield futures[future], None, e
+
+
 def get_model_type_from_path(file_path: Path) -> str:
     """Determine model type from file path.
     
@@ -352,15 +612,8 @@ def clean_filename(filename: str) -> str:
     Returns:
         Cleaned filename
     """
-    import platform
-    
-    if platform.system() == "Windows":
-        illegal_chars = r'[\\/:*?"<>|]'
-    else:
-        illegal_chars = r'[/]'
-    
     name, ext = os.path.splitext(filename)
-    clean_name = re.sub(illegal_chars, '', name)
-    clean_name = re.sub(r'\s+', ' ', clean_name.strip())
+    clean_name = _ILLEGAL_RE.sub('', name)
+    clean_name = _WS_RE.sub(' ', clean_name.strip())
     
     return f"{clean_name}{ext}"
\ No newline at end of file
@@ -4,6 +4,8 @@ from .formatting import (
     format_model_info,
     format_search_results,
     format_file_size,
+    mask_secret,
+    progress_enabled,
     format_model_versions,
     format_version_files,
     print_error,
@@ -13,12 +15,14 @@ from .formatting import (
     safe_str,
 )
 
-from .report import generate_update_report
+from .report import generate_update_report, write_update_report
 
 __all__ = [
     "format_model_info",
     "format_search_results",
     "format_file_size",
+    "mask_secret",
+    "progress_enabled",
     "format_model_versions",
     "format_version_files",
     "print_error",
@@ -27,4 +31,5 @@ __all__ = [
     "print_info",
     "safe_str",
     "generate_update_report",
+    "write_update_report",
 ]
\ No newline at end of file
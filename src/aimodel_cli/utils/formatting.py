@@ -1,17 +1,151 @@
 """Utility functions for formatting output."""
 
+import codecs
+import os
 import sys
-from typing import Any, Dict, List
-from rich.console import Console
-from rich.table import Table
-from rich.text import Text
-
-def safe_str(text: str) -> str:
-    """Safely encode string for console output."""
-    if sys.platform == "win32":
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+# Rich is imported on first use, so commands that never print skip its import cost
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+# Shared console; constructing one per call probes the terminal every time
+_CONSOLE: Optional["Console"] = None
+
+# Display units, indexed by power of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Display text for flags, indexed by their truth value
+_YESNO = ("No", "Yes")
+
+# Table column schemas as (header, style, width)
+_SEARCH_COLUMNS = (
+    ("ID", "cyan", 10),
+    ("Name", "green", 35),
+    ("Type", "yellow", 12),
+    ("Base Model", "blue", 15),
+    ("Files", "red", 5),
+    ("NSFW", "red", 5),
+)
+_VERSION_COLUMNS = (
+    ("ID", "cyan", 8),
+    ("Name", "green", 25),
+    ("Base Model", "blue", 15),
+    ("Published", "yellow", 12),
+    ("Files", "red", 6),
+)
+_FILE_COLUMNS = (
+    ("ID", "cyan", 8),
+    ("Name", "green", 35),
+    ("Size", "blue", 10),
+    ("Format", "yellow", 12),
+    ("Primary", "red", 8),
+)
+
+
+def progress_enabled() -> bool:
+    """Check whether live progress displays should be rendered.
+    
+    Progress is skipped when stdout is not a terminal (pipes, files, CI logs)
+    or when the AIMODEL_NO_PROGRESS environment variable is set.
+    
+    Returns:
+        True if progress should be shown
+    """
+    return sys.stdout.isatty() and not os.environ.get("AIMODEL_NO_PROGRESS")
+
+
+# The platform cannot change at runtime, so pick the implementation once
+if sys.platform == "win32":
+    # Bound once, so each call skips the codec registry lookup
+    _ascii_encode = codecs.getencoder('ascii')
+    
+    def safe_str(text: str) -> str:
+        """Safely encode string for console output."""
+        if text.isascii():
+            return text
         # Replace problematic characters for Windows console
-        return text.encode('ascii', 'replace').decode('ascii')
-    return text
+        return _ascii_encode(text, 'replace')[0].decode('ascii')
+else:
+    def safe_str(text: str) -> str:
+        """Safely encode string for console output."""
+        return text
+
+
+def _get_console() -> "Console":
+    """Get the shared console, creating it on first use."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
+def _new_table(columns: Tuple[Tuple[str, str, int], ...]) -> "Table":
+    """Create a table with the given column schema.
+    
+    Args:
+        columns: Column (header, style, width) tuples
+        
+    Returns:
+        Empty table with a styled header
+    """
+    from rich.table import Table
+    
+    table = Table(show_header=True, header_style="bold magenta")
+    for header, style, width in columns:
+        table.add_column(header, style=style, width=width)
+    return table
+
+
+def _truncate(text: str, limit: int, keep: int) -> str:
+    """Shorten text that is longer than a limit.
+    
+    Args:
+        text: Text to shorten
+        limit: Maximum length left untouched
+        keep: Number of leading characters kept before the ellipsis
+        
+    Returns:
+        The text itself, or its first ``keep`` characters followed by "..."
+    """
+    return text if len(text) <= limit else f"{text[:keep]}..."
+
+
+def _clean(text: str, limit: int, keep: int) -> str:
+    """Shorten text like _truncate and make it safe for console output.
+    
+    safe_str keeps the length of the text, so truncating first gives the
+    same result while sanitizing only the characters that are kept.
+    
+    Args:
+        text: Text to clean
+        limit: Maximum length left untouched
+        keep: Number of leading characters kept before the ellipsis
+        
+    Returns:
+        Shortened, console-safe text
+    """
+    return safe_str(_truncate(text, limit, keep))
+
+
+def _latest_version_summary(model: Dict[str, Any]) -> Tuple[str, int]:
+    """Summarize a model's latest version for a table row.
+    
+    Args:
+        model: Model item from API
+        
+    Returns:
+        Tuple of (console-safe base model, number of files)
+    """
+    versions = model.get('modelVersions')
+    if not versions:
+        return 'Unknown', 0
+    
+    latest = versions[0]
+    return safe_str(latest.get('baseModel', 'Unknown')), len(latest.get('files') or ())
 
 
 def format_model_info(model_data: Dict[str, Any]) -> str:
@@ -29,21 +163,23 @@ def format_model_info(model_data: Dict[str, Any]) -> str:
     model = model_data['items'][0]
     versions = model.get('modelVersions', [])
     
-    lines = []
-    lines.append(f"Name: {safe_str(model.get('name', 'Unknown'))}")
-    lines.append(f"ID: {model.get('id', 'Unknown')}")
-    lines.append(f"Type: {safe_str(model.get('type', 'Unknown'))}")
-    lines.append(f"NSFW: {'Yes' if model.get('nsfw') else 'No'}")
+    # The fixed fields form a single header string; only the optional
+    # sections below are collected as separate lines
+    header = (
+        f"Name: {safe_str(model.get('name', 'Unknown'))}\n"
+        f"ID: {model.get('id', 'Unknown')}\n"
+        f"Type: {safe_str(model.get('type', 'Unknown'))}\n"
+        f"NSFW: {_YESNO[bool(model.get('nsfw'))]}"
+    )
+    lines = [header]
     
     if model.get('description'):
-        desc = safe_str(model['description'][:200])
-        if len(model['description']) > 200:
-            desc += "..."
+        desc = _clean(model['description'], 200, 200)
         lines.append(f"Description: {desc}")
     
     if versions:
         lines.append(f"\nVersions ({len(versions)}):")
-        for i, version in enumerate(versions[:5]):  # Show first 5 versions
+        for i, version in enumerate(islice(versions, 5)):  # Show first 5 versions
             version_name = safe_str(version.get('name', f'Version {i+1}'))
             base_model = safe_str(version.get('baseModel', 'Unknown'))
             files_count = len(version.get('files', []))
@@ -61,41 +197,27 @@ def format_search_results(models_data: Dict[str, Any]) -> None:
     Args:
         models_data: Search results from API
     """
-    console = Console()
+    console = _get_console()
     
     if not models_data.get('items'):
         console.print("No models found.")
         return
     
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("ID", style="cyan", width=10)
-    table.add_column("Name", style="green", width=35)
-    table.add_column("Type", style="yellow", width=12)
-    table.add_column("Base Model", style="blue", width=15)
-    table.add_column("Files", style="red", width=5)
-    table.add_column("NSFW", style="red", width=5)
+    table = _new_table(_SEARCH_COLUMNS)
+    
+    add_row = table.add_row
     
     for model in models_data['items']:
         model_id = str(model.get('id', ''))
-        name = safe_str(model.get('name', 'Unknown'))
+        # Truncate name if too long
+        name = _clean(model.get('name', 'Unknown'), 32, 29)
         model_type = safe_str(model.get('type', 'Unknown'))
-        nsfw = "Yes" if model.get('nsfw') else "No"
+        nsfw = _YESNO[bool(model.get('nsfw'))]
         
         # Get info from latest version
-        versions = model.get('modelVersions', [])
-        if versions:
-            latest_version = versions[0]
-            base_model = safe_str(latest_version.get('baseModel', 'Unknown'))
-            files_count = len(latest_version.get('files', []))
-        else:
-            base_model = 'Unknown'
-            files_count = 0
-        
-        # Truncate name if too long
-        if len(name) > 32:
-            name = name[:29] + "..."
+        base_model, files_count = _latest_version_summary(model)
         
-        table.add_row(
+        add_row(
             model_id,
             name,
             model_type,
@@ -104,14 +226,16 @@ def format_search_results(models_data: Dict[str, Any]) -> None:
             nsfw
         )
     
-    console.print(table)
-    
-    # Show pagination info
-    metadata = models_data.get('metadata', {})
-    if 'currentPage' in metadata or 'totalPages' in metadata:
-        current_page = metadata.get('currentPage', 1)
-        total_pages = metadata.get('totalPages', '?')
-        console.print(f"\nPage {current_page} of {total_pages}")
+    # Buffer the table and pagination line so they go out in a single write
+    with console:
+        console.print(table)
+        
+        # Show pagination info
+        metadata = models_data.get('metadata', {})
+        if 'currentPage' in metadata or 'totalPages' in metadata:
+            current_page = metadata.get('currentPage', 1)
+            total_pages = metadata.get('totalPages', '?')
+            console.print(f"\nPage {current_page} of {total_pages}")
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -123,11 +247,25 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    
+    # The bit length gives the power of 1024 directly, without a division loop
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
+
+
+def mask_secret(value: Any) -> str:
+    """Mask a secret value, keeping only its last four characters.
+    
+    Args:
+        value: Secret value to mask
+        
+    Returns:
+        Fixed-width masked string
+    """
+    text = str(value)
+    return f"****{text[-4:]}" if len(text) > 4 else "****"
 
 
 def format_model_versions(model_data: Dict[str, Any]) -> None:
@@ -136,7 +274,7 @@ def format_model_versions(model_data: Dict[str, Any]) -> None:
     Args:
         model_data: Model data from API
     """
-    console = Console()
+    console = _get_console()
     
     if not model_data.get('items'):
         console.print("No model data available.")
@@ -149,14 +287,8 @@ def format_model_versions(model_data: Dict[str, Any]) -> None:
         console.print("No versions available.")
         return
     
-    console.print(f"[bold]Versions for {model.get('name', 'Unknown')}[/bold]\n")
-    
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("ID", style="cyan", width=8)
-    table.add_column("Name", style="green", width=25)
-    table.add_column("Base Model", style="blue", width=15)
-    table.add_column("Published", style="yellow", width=12)
-    table.add_column("Files", style="red", width=6)
+    table = _new_table(_VERSION_COLUMNS)
+    add_row = table.add_row
     
     for version in versions:
         version_id = str(version.get('id', ''))
@@ -164,14 +296,13 @@ def format_model_versions(model_data: Dict[str, Any]) -> None:
         base_model = version.get('baseModel', 'Unknown')
         published = version.get('publishedAt', '')
         if published:
-            published = published.split('T')[0]  # Just the date part
+            published = published[:10]  # Just the YYYY-MM-DD date part
         files_count = len(version.get('files', []))
         
         # Truncate name if too long
-        if len(name) > 23:
-            name = name[:20] + "..."
+        name = _truncate(name, 23, 20)
         
-        table.add_row(
+        add_row(
             version_id,
             name,
             base_model,
@@ -179,7 +310,10 @@ def format_model_versions(model_data: Dict[str, Any]) -> None:
             str(files_count)
         )
     
-    console.print(table)
+    # Buffer the heading and table so they go out in a single write
+    with console:
+        console.print(f"[bold]Versions for {model.get('name', 'Unknown')}[/bold]\n")
+        console.print(table)
 
 
 def format_version_files(version_data: Dict[str, Any]) -> None:
@@ -188,22 +322,16 @@ def format_version_files(version_data: Dict[str, Any]) -> None:
     Args:
         version_data: Version data from API
     """
-    console = Console()
+    console = _get_console()
     
     files = version_data.get('files', [])
     if not files:
         console.print("No files available.")
         return
     
-    version_name = version_data.get('name', 'Unknown')
-    console.print(f"[bold]Files in version: {version_name}[/bold]\n")
+    table = _new_table(_FILE_COLUMNS)
     
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("ID", style="cyan", width=8)
-    table.add_column("Name", style="green", width=35)
-    table.add_column("Size", style="blue", width=10)
-    table.add_column("Format", style="yellow", width=12)
-    table.add_column("Primary", style="red", width=8)
+    add_row = table.add_row
     
     for file_info in files:
         file_id = str(file_info.get('id', ''))
@@ -214,13 +342,12 @@ def format_version_files(version_data: Dict[str, Any]) -> None:
         metadata = file_info.get('metadata', {})
         format_info = metadata.get('format', 'Unknown')
         
-        is_primary = "Yes" if file_info.get('primary') else "No"
+        is_primary = _YESNO[bool(file_info.get('primary'))]
         
         # Truncate name if too long
-        if len(name) > 33:
-            name = name[:30] + "..."
+        name = _truncate(name, 33, 30)
         
-        table.add_row(
+        add_row(
             file_id,
             name,
             size_str,
@@ -228,7 +355,11 @@ def format_version_files(version_data: Dict[str, Any]) -> None:
             is_primary
         )
     
-    console.print(table)
+    # Buffer the heading and table so they go out in a single write
+    with console:
+        version_name = version_data.get('name', 'Unknown')
+        console.print(f"[bold]Files in version: {version_name}[/bold]\n")
+        console.print(table)
 
 
 def print_error(message: str) -> None:
@@ -237,8 +368,7 @@ def print_error(message: str) -> None:
     Args:
         message: Error message
     """
-    console = Console()
-    console.print(f"[bold red]Error:[/bold red] {message}")
+    _get_console().print(f"[bold red]Error:[/bold red] {message}")
 
 
 def print_success(message: str) -> None:
@@ -247,8 +377,7 @@ def print_success(message: str) -> None:
     Args:
         message: Success message
     """
-    console = Console()
-    console.print(f"[bold green]Success:[/bold green] {message}")
+    _get_console().print(f"[bold green]Success:[/bold green] {message}")
 
 
 def print_warning(message: str) -> None:
@@ -257,8 +386,7 @@ def print_warning(message: str) -> None:
     Args:
         message: Warning message
     """
-    console = Console()
-    console.print(f"[bold yellow]Warning:[/bold yellow] {message}")
+    _get_console().print(f"[bold yellow]Warning:[/bold yellow] {message}")
 
 
 def print_info(message: str) -> None:
@@ -267,5 +395,4 @@ def print_info(message: str) -> None:
     Args:
         message: Info message
     """
-    console = Console()
-    console.print(f"[bold blue]Info:[/bold blue] {message}")
\ No newline at end of file
+    _get_console().print(f"[bold blue]Info:[/bold blue] {message}")
\ No newline at end of file
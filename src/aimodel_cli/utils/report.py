@@ -3,7 +3,7 @@
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO
 
 
 def generate_update_report(
@@ -22,60 +22,82 @@ def generate_update_report(
         report_path: Path to save the report
         include_up_to_date: Whether to include up-to-date models in report
     """
-    lines = []
+    with open(report_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write_update_report(updates_available, up_to_date, errors, f, include_up_to_date)
+
+
+def write_update_report(
+    updates_available: List[Dict[str, Any]],
+    up_to_date: List[Dict[str, Any]],
+    errors: List[Dict[str, Any]],
+    out: TextIO,
+    include_up_to_date: bool = False
+) -> None:
+    """Stream a Markdown report for model updates to an open text file.
+    
+    Each model section is written as soon as it is formatted, so memory use
+    does not grow with the number of models in the report.
+    
+    Args:
+        updates_available: List of models with updates available
+        up_to_date: List of models that are up to date
+        errors: List of models that had errors during checking
+        out: Text-mode file to write the report to
+        include_up_to_date: Whether to include up-to-date models in report
+    """
+    def write_lines(lines: List[str]) -> None:
+        out.write("\n".join(lines))
+        out.write("\n")
     
     # Header
-    lines.append("# AI Model Update Report")
-    lines.append("")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
+    write_lines([
+        "# AI Model Update Report",
+        "",
+        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "",
+    ])
     
     # Summary
     total_checked = len(updates_available) + len(up_to_date) + len(errors)
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- **Total models checked:** {total_checked}")
-    lines.append(f"- **Updates available:** {len(updates_available)}")
-    lines.append(f"- **Up to date:** {len(up_to_date)}")
-    lines.append(f"- **Errors:** {len(errors)}")
-    lines.append("")
+    write_lines([
+        "## Summary",
+        "",
+        f"- **Total models checked:** {total_checked}",
+        f"- **Updates available:** {len(updates_available)}",
+        f"- **Up to date:** {len(up_to_date)}",
+        f"- **Errors:** {len(errors)}",
+        "",
+    ])
     
     # Models with updates available
     if updates_available:
-        lines.append("## 🔄 Models with Updates Available")
-        lines.append("")
+        write_lines(["## 🔄 Models with Updates Available", ""])
         
         for update in updates_available:
-            lines.extend(_format_model_update(update))
+            lines = _format_model_update(update)
             lines.append("")
+            write_lines(lines)
     
     # Up-to-date models (if requested)
     if include_up_to_date and up_to_date:
-        lines.append("## ✅ Models Up to Date")
-        lines.append("")
+        write_lines(["## ✅ Models Up to Date", ""])
         
         for model in up_to_date:
-            lines.extend(_format_model_current(model))
+            lines = _format_model_current(model)
             lines.append("")
+            write_lines(lines)
     
     # Errors
     if errors:
-        lines.append("## ❌ Errors Encountered")
-        lines.append("")
+        write_lines(["## ❌ Errors Encountered", ""])
         
         for error in errors:
-            lines.append(f"- **{error['file'].name}:** {error['error']}")
+            out.write(f"- **{error['file'].name}:** {error['error']}\n")
         
-        lines.append("")
+        out.write("\n")
     
     # Footer
-    lines.append("---")
-    lines.append("*Generated by AI Model CLI*")
-    
-    # Write report
-    report_content = "\n".join(lines)
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write(report_content)
+    write_lines(["---", "*Generated by AI Model CLI*"])
 
 
 def _format_model_update(update: Dict[str, Any]) -> List[str]:
@@ -101,14 +123,14 @@ def _format_model_update(update: Dict[str, Any]) -> List[str]:
     lines.append("")
     
     # Add preview image if available
-    preview_images = _get_preview_images(latest_version)
+    preview_images = _get_preview_images(latest_version, limit=3)  # Show up to 3 images
     if preview_images:
         lines.append("#### Preview")
         lines.append("")
         # Create a horizontal layout for multiple images
         if len(preview_images) > 1:
             lines.append('<div style="display: flex; flex-wrap: wrap; gap: 8px;">')
-            for i, img_url in enumerate(preview_images[:3]):  # Show up to 3 images
+            for i, img_url in enumerate(preview_images):
                 lines.append(f'  <img src="{img_url}" alt="Preview {i+1}" width="256" style="max-width: 256px; height: auto;" />')
             lines.append('</div>')
         else:
@@ -212,7 +234,7 @@ def _format_model_current(model: Dict[str, Any]) -> List[str]:
     
     # Add preview image if available
     if current_version:
-        preview_images = _get_preview_images(current_version)
+        preview_images = _get_preview_images(current_version, limit=1)
         if preview_images:
             lines.append("#### Preview")
             lines.append("")
@@ -240,11 +262,12 @@ def _format_model_current(model: Dict[str, Any]) -> List[str]:
     return lines
 
 
-def _get_preview_images(version: Dict[str, Any]) -> List[str]:
+def _get_preview_images(version: Dict[str, Any], limit: Optional[int] = None) -> List[str]:
     """Extract preview image URLs from version data.
     
     Args:
         version: Version data from CivitAI API
+        limit: Maximum number of URLs to return (all if None)
         
     Returns:
         List of preview image URLs
@@ -254,6 +277,9 @@ def _get_preview_images(version: Dict[str, Any]) -> List[str]:
     # Get images from version
     images = version.get("images", [])
     for image in images:
+        if limit is not None and len(preview_urls) >= limit:
+            break
+        
         url = image.get("url")
         if url:
             # Use medium size for better loading performance
@@ -0,0 +1,92 @@
+"""Tests for the metadata completion command."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from aimodel_cli.commands import metadata
+from aimodel_cli.models import HashCache, ModelInfo
+from aimodel_cli.models import model_info as model_info_module
+
+VERSION_DATA = {
+    "id": 2,
+    "modelId": 1,
+    "baseModel": "SDXL 1.0",
+    "trainedWords": ["token"],
+    "images": [{"type": "image", "url": "https://example.com/width=450/a.png"}],
+    "model": {"id": 1, "name": "Example"},
+}
+
+
+class StubClient:
+    """Client that answers every hash lookup with VERSION_DATA."""
+    
+    def __init__(self):
+        self.hashes: List[str] = []
+    
+    def search_by_hash(self, hash_value: str) -> Dict[str, Any]:
+        self.hashes.append(hash_value)
+        return VERSION_DATA
+
+
+@pytest.fixture
+def model_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a model file and isolate the persistent hash cache."""
+    cache = HashCache(tmp_path / "hashes.sqlite")
+    monkeypatch.setattr(model_info_module, "get_hash_cache", lambda: cache)
+    
+    path = tmp_path / "model.safetensors"
+    path.write_bytes(b"model weights")
+    return path
+
+
+def _process_preview_only(
+    model_file: Path,
+    **kwargs: Any
+) -> Tuple[str, List[Tuple[ModelInfo, Dict[str, Any]]]]:
+    """Run _process_single_file in preview-only mode with queued previews."""
+    preview_jobs: List[Tuple[ModelInfo, Dict[str, Any]]] = []
+    result = metadata._process_single_file(
+        model_file,
+        StubClient(),
+        force=kwargs.pop("force", False),
+        metadata_only=False,
+        preview_only=True,
+        preview_jobs=preview_jobs,
+        **kwargs
+    )
+    return result, preview_jobs
+
+
+def test_preview_only_does_not_create_json(model_file: Path) -> None:
+    result, preview_jobs = _process_preview_only(model_file)
+    
+    assert result == "success"
+    assert len(preview_jobs) == 1
+    assert not model_file.with_suffix(".json").exists()
+
+
+def test_preview_only_with_batched_lookup_does_not_create_json(model_file: Path) -> None:
+    result, preview_jobs = _process_preview_only(
+        model_file,
+        file_hash="ABC",
+        lookups={"ABC": VERSION_DATA},
+    )
+    
+    assert result == "success"
+    assert len(preview_jobs) == 1
+    assert not model_file.with_suffix(".json").exists()
+
+
+def test_preview_only_does_not_modify_existing_json(model_file: Path) -> None:
+    json_path = model_file.with_suffix(".json")
+    json_path.write_text('{"modelId": 99}', encoding="utf-8")
+    before = json_path.stat().st_mtime_ns
+    
+    result, preview_jobs = _process_preview_only(model_file, force=True)
+    
+    assert result == "success"
+    assert len(preview_jobs) == 1
+    assert json_path.read_text(encoding="utf-8") == '{"modelId": 99}'
+    assert json_path.stat().st_mtime_ns == before